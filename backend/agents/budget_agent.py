@@ -2,7 +2,8 @@
 Budget Analysis Agent
 Analyzes user spending patterns and provides financial insights
 """
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 from core.granite_api import generate
 from core.utils import (
     calculate_total_expenses,
@@ -12,6 +13,28 @@ from core.utils import (
 )
 from core.logger import logger
 
+# Prompt for the AI insights; filled in by _build_prompt
+BUDGET_PROMPT = """You are a personal finance advisor. Analyze this budget and provide 3-4 short, actionable insights.
+
+{persona_context}
+
+Budget Details:
+- Monthly Income: {income}
+- Total Expenses: {total_expenses}
+- Savings: {savings}
+- Savings Rate: {savings_rate}%
+
+Top Expense Categories:
+{top_expenses}
+
+Provide 3-4 brief, specific recommendations to improve their financial situation. Keep each point under 20 words."""
+
+PERSONA_CONTEXTS = {
+    "student": "The user is a student with limited income. Focus on budgeting basics and smart spending.",
+    "professional": "The user is a working professional. Focus on investment opportunities and wealth building.",
+    "general": "Provide general financial advice suitable for most people."
+}
+
 
 def analyze_budget(income: float, expenses: Dict[str, float], persona: str = "general") -> Dict[str, Any]:
     """
@@ -45,22 +68,7 @@ def analyze_budget(income: float, expenses: Dict[str, float], persona: str = "ge
         }
 
         # Build AI prompt based on persona
-        persona_context = _get_persona_context(persona)
-
-        prompt = f"""You are a personal finance advisor. Analyze this budget and provide 3-4 short, actionable insights.
-
-{persona_context}
-
-Budget Details:
-- Monthly Income: {format_currency(income)}
-- Total Expenses: {format_currency(total_expenses)}
-- Savings: {format_currency(income - total_expenses)}
-- Savings Rate: {savings_rate}%
-
-Top Expense Categories:
-{_format_expenses_list(top_expenses)}
-
-Provide 3-4 brief, specific recommendations to improve their financial situation. Keep each point under 20 words."""
+        prompt = _build_prompt(income, total_expenses, savings_rate, tuple(top_expenses), persona)
 
         # Generate insights using AI
         ai_response = generate(prompt, max_new_tokens=250, temperature=0.7)
@@ -84,14 +92,23 @@ Provide 3-4 brief, specific recommendations to improve their financial situation
         }
 
 
+@lru_cache(maxsize=128)
+def _build_prompt(income: float, total_expenses: float, savings_rate: float,
+                  top_expenses: Tuple[Tuple[str, float], ...], persona: str) -> str:
+    """Fill in the budget prompt; repeated budgets reuse the rendered string"""
+    return BUDGET_PROMPT.format(
+        persona_context=_get_persona_context(persona),
+        income=format_currency(income),
+        total_expenses=format_currency(total_expenses),
+        savings=format_currency(income - total_expenses),
+        savings_rate=savings_rate,
+        top_expenses=_format_expenses_list(top_expenses)
+    )
+
+
 def _get_persona_context(persona: str) -> str:
     """Get context based on user persona"""
-    contexts = {
-        "student": "The user is a student with limited income. Focus on budgeting basics and smart spending.",
-        "professional": "The user is a working professional. Focus on investment opportunities and wealth building.",
-        "general": "Provide general financial advice suitable for most people."
-    }
-    return contexts.get(persona.lower(), contexts["general"])
+    return PERSONA_CONTEXTS.get(persona.lower(), PERSONA_CONTEXTS["general"])
 
 
 def _format_expenses_list(top_expenses) -> str:
@@ -2,11 +2,38 @@
 Goal Planning Agent
 Creates savings plans and provides advice for financial goals
 """
-from typing import Dict, Any
-from core.granite_api import generate
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Tuple
+from core.granite_api import generate, stream
 from core.utils import calculate_monthly_savings_needed, format_currency
 from core.logger import logger
 
+# Prompt for the AI advice on a plan; filled in by _build_prompt
+GOAL_PROMPT = """You are a financial planning advisor. Create a motivational and actionable savings plan.
+
+{persona_context}
+
+Goal Details:
+- Goal: {goal_name}
+- Target Amount: {target_amount}
+- Current Savings: {current_savings}
+- Timeline: {months} months
+- Monthly Income: {income}
+- Required Monthly Saving: {monthly_savings_needed} ({percentage_of_income:.1f}% of income)
+
+Provide:
+1. Brief assessment of goal feasibility
+2. 2-3 specific strategies to reach this goal
+3. Motivational encouragement
+
+Keep it concise and actionable (under 150 words)."""
+
+PERSONA_CONTEXTS = {
+    "student": "The user is a student. Focus on achievable small steps and building habits.",
+    "professional": "The user is a working professional. Focus on strategic planning and optimization.",
+    "general": "Provide practical financial planning advice."
+}
+
 
 def plan_goal(
     goal_name: str,
@@ -14,7 +41,8 @@ def plan_goal(
     months: int,
     income: float,
     persona: str = "general",
-    current_savings: float = 0.0
+    current_savings: float = 0.0,
+    include_advice: bool = True
 ) -> Dict[str, Any]:
     """
     Create a savings plan for a financial goal
@@ -26,54 +54,20 @@ def plan_goal(
         income: Monthly income
         persona: User persona
         current_savings: Current savings amount
+        include_advice: Whether to generate AI advice (empty string if not)
 
     Returns:
         Dict containing plan details and AI advice
     """
-    try:
-        logger.info(f"Creating goal plan: {goal_name}")
-
-        # Calculate required monthly savings
-        monthly_needed = calculate_monthly_savings_needed(target_amount, months, current_savings)
-
-        # Calculate percentage of income
-        income_percentage = (monthly_needed / income * 100) if income > 0 else 0
-
-        # Create plan
-        plan = {
-            "goal_name": goal_name,
-            "target_amount": target_amount,
-            "current_savings": current_savings,
-            "remaining_amount": target_amount - current_savings,
-            "months": months,
-            "monthly_savings_needed": monthly_needed,
-            "percentage_of_income": round(income_percentage, 2)
-        }
-
-        # Build AI prompt
-        persona_context = _get_persona_context(persona)
-
-        prompt = f"""You are a financial planning advisor. Create a motivational and actionable savings plan.
-
-{persona_context}
+    logger.info(f"Creating goal plan: {goal_name}")
 
-Goal Details:
-- Goal: {goal_name}
-- Target Amount: {format_currency(target_amount)}
-- Current Savings: {format_currency(current_savings)}
-- Timeline: {months} months
-- Monthly Income: {format_currency(income)}
-- Required Monthly Saving: {format_currency(monthly_needed)} ({income_percentage:.1f}% of income)
-
-Provide:
-1. Brief assessment of goal feasibility
-2. 2-3 specific strategies to reach this goal
-3. Motivational encouragement
-
-Keep it concise and actionable (under 150 words)."""
+    plan = _build_plan(goal_name, target_amount, months, income, current_savings)
+    if not include_advice:
+        return {"plan": plan, "advice": ""}
 
+    try:
         # Generate advice using AI
-        advice = generate(prompt, max_new_tokens=200, temperature=0.7)
+        advice = generate(_build_prompt(plan, income, persona), max_new_tokens=200, temperature=0.7)
 
         logger.info(f"Goal plan created successfully for: {goal_name}")
 
@@ -87,18 +81,137 @@ Keep it concise and actionable (under 150 words)."""
         # Return fallback advice
         return {
             "plan": plan,
-            "advice": _get_fallback_advice(goal_name, monthly_needed, income_percentage)
+            "advice": _get_fallback_advice(goal_name, plan["monthly_savings_needed"], plan["percentage_of_income"])
         }
 
 
+def stream_goal_plan(
+    goal_name: str,
+    target_amount: float,
+    months: int,
+    income: float,
+    persona: str = "general",
+    current_savings: float = 0.0
+) -> Tuple[Dict[str, Any], Iterator[str]]:
+    """
+    Create a savings plan for a financial goal, streaming the AI advice
+
+    Args:
+        goal_name: Name of the financial goal
+        target_amount: Target amount to save
+        months: Number of months to reach the goal
+        income: Monthly income
+        persona: User persona
+        current_savings: Current savings amount
+
+    Returns:
+        Tuple of the plan details and an iterator over pieces of the advice
+    """
+    logger.info(f"Streaming goal plan: {goal_name}")
+
+    plan = _build_plan(goal_name, target_amount, months, income, current_savings)
+
+    def advice_chunks() -> Iterator[str]:
+        sent_any = False
+        try:
+            for chunk in stream(_build_prompt(plan, income, persona), max_new_tokens=200, temperature=0.7):
+                sent_any = True
+                yield chunk
+        except Exception as e:
+            logger.error(f"Goal plan streaming failed: {str(e)}")
+            # Only fall back if nothing reached the client yet
+            if not sent_any:
+                yield _get_fallback_advice(goal_name, plan["monthly_savings_needed"], plan["percentage_of_income"])
+
+    return plan, advice_chunks()
+
+
+def plan_goal_scenarios(
+    goal_name: str,
+    target_amount: float,
+    months_list: List[int],
+    income: float,
+    persona: str = "general",
+    current_savings: float = 0.0,
+    include_advice: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Create savings plans for several timelines of the same goal at once
+
+    Args:
+        goal_name: Name of the financial goal
+        target_amount: Target amount to save
+        months_list: Timelines (in months) to plan for
+        income: Monthly income
+        persona: User persona
+        current_savings: Current savings amount
+        include_advice: Whether to generate AI advice for each plan
+
+    Returns:
+        List of plan dicts (same shape as plan_goal), in months_list order
+    """
+    logger.info(f"Creating {len(months_list)} goal plan scenarios: {goal_name}")
+
+    # One at a time (months_list holds at most 3), so the shared pipeline is never hit concurrently
+    return [
+        plan_goal(goal_name, target_amount, months, income, persona, current_savings, include_advice)
+        for months in months_list
+    ]
+
+
+def _build_plan(
+    goal_name: str,
+    target_amount: float,
+    months: int,
+    income: float,
+    current_savings: float
+) -> Dict[str, Any]:
+    """Compute the savings plan figures for a goal"""
+    # Calculate required monthly savings
+    monthly_needed = calculate_monthly_savings_needed(target_amount, months, current_savings)
+
+    # Calculate percentage of income
+    income_percentage = (monthly_needed / income * 100) if income > 0 else 0
+
+    return {
+        "goal_name": goal_name,
+        "target_amount": target_amount,
+        "current_savings": current_savings,
+        "remaining_amount": target_amount - current_savings,
+        "months": months,
+        "monthly_savings_needed": monthly_needed,
+        "percentage_of_income": round(income_percentage, 2)
+    }
+
+
+def _build_prompt(plan: Dict[str, Any], income: float, persona: str) -> str:
+    """Build the AI prompt asking for advice on a savings plan"""
+    return _render_prompt(
+        plan["goal_name"], plan["target_amount"], plan["current_savings"], plan["months"],
+        plan["monthly_savings_needed"], plan["percentage_of_income"], income, persona
+    )
+
+
+@lru_cache(maxsize=128)
+def _render_prompt(goal_name: str, target_amount: float, current_savings: float, months: int,
+                   monthly_savings_needed: float, percentage_of_income: float,
+                   income: float, persona: str) -> str:
+    """Fill in the goal prompt; repeated plans reuse the rendered string"""
+    return GOAL_PROMPT.format(
+        persona_context=_get_persona_context(persona),
+        goal_name=goal_name,
+        target_amount=format_currency(target_amount),
+        current_savings=format_currency(current_savings),
+        months=months,
+        income=format_currency(income),
+        monthly_savings_needed=format_currency(monthly_savings_needed),
+        percentage_of_income=percentage_of_income
+    )
+
+
 def _get_persona_context(persona: str) -> str:
     """Get context based on user persona"""
-    contexts = {
-        "student": "The user is a student. Focus on achievable small steps and building habits.",
-        "professional": "The user is a working professional. Focus on strategic planning and optimization.",
-        "general": "Provide practical financial planning advice."
-    }
-    return contexts.get(persona.lower(), contexts["general"])
+    return PERSONA_CONTEXTS.get(persona.lower(), PERSONA_CONTEXTS["general"])
 
 
 def _get_fallback_advice(goal_name: str, monthly_needed: float, income_percentage: float) -> str:
@@ -2,12 +2,30 @@
 IBM Granite Model API Integration
 Handles model loading and text generation using Hugging Face Transformers
 """
-from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
+from threading import Event, Lock, Thread
+from typing import Iterator
+from transformers import (
+    pipeline, AutoTokenizer, AutoModelForCausalLM, StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+)
 import torch
 from config.settings import MODEL_ID, DEVICE, CACHE_DIR, MAX_NEW_TOKENS, DEFAULT_TEMPERATURE
 from core.logger import logger
 from core.response_cache import response_cache
 
+# _clean_response keeps at most this many sentences
+MAX_SENTENCES = 3
+
+
+class _StopOnEvent(StoppingCriteria):
+    """Stops generation once the event is set, e.g. when the streaming client goes away"""
+
+    def __init__(self, event: Event):
+        self.event = event
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.event.is_set()
+
+
 class GraniteAPI:
     """
     Singleton class for managing IBM Granite model instance
@@ -15,6 +33,7 @@ class GraniteAPI:
     _instance = None
     _pipeline = None
     _initialized = False
+    _load_lock = Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -111,70 +130,18 @@ class GraniteAPI:
         if cached_response:
             return cached_response
 
-        # Lazy load model on first use
-        if GraniteAPI._pipeline is None and not GraniteAPI._initialized:
-            logger.info("Model not loaded yet. Loading now...")
-            self._load_model()
-            GraniteAPI._initialized = True
-
-        if GraniteAPI._pipeline is None:
-            error_msg = "Model failed to load. Cannot generate text."
-            logger.error(error_msg)
-            raise Exception(error_msg)
+        self._ensure_loaded()
 
         try:
             logger.info(f"Generating response for prompt: {prompt[:100]}...")
 
-            # Generate text with optimized parameters for CPU speed
-            # Use greedy decoding when temperature is 0 for faster generation
-            if temperature == 0.0:
-                result = GraniteAPI._pipeline(
-                    prompt,
-                    max_new_tokens=max_new_tokens,
-                    do_sample=False,  # Greedy decoding - much faster
-                    num_return_sequences=1,
-                    pad_token_id=GraniteAPI._pipeline.tokenizer.eos_token_id,
-                    eos_token_id=GraniteAPI._pipeline.tokenizer.eos_token_id
-                )
-            else:
-                # Sampling mode - slower but more diverse
-                result = GraniteAPI._pipeline(
-                    prompt,
-                    max_new_tokens=max_new_tokens,
-                    temperature=temperature,
-                    do_sample=True,
-                    top_p=0.95,
-                    top_k=50,
-                    repetition_penalty=1.2,
-                    num_return_sequences=1,
-                    pad_token_id=GraniteAPI._pipeline.tokenizer.eos_token_id,
-                    eos_token_id=GraniteAPI._pipeline.tokenizer.eos_token_id
-                )
+            result = GraniteAPI._pipeline(prompt, **self._generation_kwargs(max_new_tokens, temperature))
 
             # Extract generated text
             generated_text = result[0]['generated_text']
 
             # Remove the prompt from the output
-            response = generated_text[len(prompt):].strip()
-
-            # Clean up the response
-            # Remove incomplete sentences at the end
-            if response:
-                # Split into sentences and take complete ones
-                sentences = response.split('.')
-                # Keep sentences that are reasonably complete
-                complete_sentences = []
-                for sent in sentences:
-                    sent = sent.strip()
-                    if len(sent) > 10:  # Minimum sentence length
-                        complete_sentences.append(sent)
-                    if len(complete_sentences) >= 3:  # Max 3 sentences for concise answers
-                        break
-
-                if complete_sentences:
-                    response = '. '.join(complete_sentences) + '.'
-                else:
-                    response = response[:200]  # Fallback: first 200 chars
+            response = self._clean_response(generated_text[len(prompt):].strip())
 
             logger.info(f"Generated response: {response[:100]}...")
 
@@ -188,6 +155,155 @@ class GraniteAPI:
             logger.error(error_msg)
             raise Exception(error_msg)
 
+    def stream(
+        self,
+        prompt: str,
+        max_new_tokens: int = MAX_NEW_TOKENS,
+        temperature: float = DEFAULT_TEMPERATURE
+    ) -> Iterator[str]:
+        """
+        Generate text using the Granite model, yielding chunks as they are decoded
+
+        Args:
+            prompt: Input text prompt
+            max_new_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature (0.0 to 1.0)
+
+        Yields:
+            str: Pieces of the generated response (the whole cached response on a cache hit)
+
+        Raises:
+            Exception: If model is not loaded or generation fails
+        """
+        cached_response = response_cache.get(prompt, max_new_tokens, temperature)
+        if cached_response:
+            yield cached_response
+            return
+
+        self._ensure_loaded()
+
+        logger.info(f"Streaming response for prompt: {prompt[:100]}...")
+
+        streamer = TextIteratorStreamer(
+            GraniteAPI._pipeline.tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True,
+            timeout=60  # don't wait forever if the worker thread dies
+        )
+        stop = Event()
+        kwargs = {
+            **self._generation_kwargs(max_new_tokens, temperature),
+            "streamer": streamer,
+            "stopping_criteria": StoppingCriteriaList([_StopOnEvent(stop)])
+        }
+
+        # The pipeline blocks until generation ends, so run it on a worker thread
+        # and hand out text as the streamer receives it
+        worker = Thread(target=GraniteAPI._pipeline, args=(prompt,), kwargs=kwargs, daemon=True)
+        worker.start()
+
+        # Yield the text as _clean_response would return it, one sentence at a time,
+        # so a streamed reply matches the same reply served from the cache
+        raw = []
+        sentences = []
+        pending = ""
+        try:
+            for chunk in streamer:
+                raw.append(chunk)
+                *done, pending = (pending + chunk).split('.')
+                for sent in done:
+                    sent = sent.strip()
+                    if len(sent) > 10:
+                        sentences.append(sent)
+                        yield (" " if len(sentences) > 1 else "") + sent + "."
+                    if len(sentences) >= MAX_SENTENCES:
+                        break
+                if len(sentences) >= MAX_SENTENCES:
+                    break
+            else:
+                # Generation ended: the text after the last period counts as a sentence too
+                sent = pending.strip()
+                if len(sent) > 10:
+                    sentences.append(sent)
+                    yield (" " if len(sentences) > 1 else "") + sent + "."
+                elif not sentences:
+                    yield "".join(raw).strip()[:200]
+        except Exception as e:
+            error_msg = f"Text generation failed: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        finally:
+            # Don't wait on the worker: tell it to stop after the current token
+            stop.set()
+
+        response_cache.set(prompt, max_new_tokens, temperature, self._clean_response("".join(raw).strip()))
+
+    def _ensure_loaded(self):
+        """Lazy load the model on first use, raising if it could not be loaded"""
+        if GraniteAPI._pipeline is None and not GraniteAPI._initialized:
+            # Concurrent first requests wait for a single load
+            with GraniteAPI._load_lock:
+                if not GraniteAPI._initialized:
+                    logger.info("Model not loaded yet. Loading now...")
+                    self._load_model()
+                    GraniteAPI._initialized = True
+
+        if GraniteAPI._pipeline is None:
+            error_msg = "Model failed to load. Cannot generate text."
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+    @staticmethod
+    def _generation_kwargs(max_new_tokens: int, temperature: float) -> dict:
+        """Pipeline arguments, optimized for CPU speed"""
+        eos_token_id = GraniteAPI._pipeline.tokenizer.eos_token_id
+
+        # Use greedy decoding when temperature is 0 for faster generation
+        if temperature == 0.0:
+            return {
+                "max_new_tokens": max_new_tokens,
+                "do_sample": False,  # Greedy decoding - much faster
+                "num_return_sequences": 1,
+                "pad_token_id": eos_token_id,
+                "eos_token_id": eos_token_id
+            }
+
+        # Sampling mode - slower but more diverse
+        return {
+            "max_new_tokens": max_new_tokens,
+            "temperature": temperature,
+            "do_sample": True,
+            "top_p": 0.95,
+            "top_k": 50,
+            "repetition_penalty": 1.2,
+            "num_return_sequences": 1,
+            "pad_token_id": eos_token_id,
+            "eos_token_id": eos_token_id
+        }
+
+    @staticmethod
+    def _clean_response(response: str) -> str:
+        """Trim a raw completion to at most three complete sentences"""
+        # Remove incomplete sentences at the end
+        if response:
+            # Split into sentences and take complete ones
+            sentences = response.split('.')
+            # Keep sentences that are reasonably complete
+            complete_sentences = []
+            for sent in sentences:
+                sent = sent.strip()
+                if len(sent) > 10:  # Minimum sentence length
+                    complete_sentences.append(sent)
+                if len(complete_sentences) >= MAX_SENTENCES:  # Max 3 sentences for concise answers
+                    break
+
+            if complete_sentences:
+                response = '. '.join(complete_sentences) + '.'
+            else:
+                response = response[:200]  # Fallback: first 200 chars
+
+        return response
+
     def is_ready(self) -> bool:
         """
         Check if the model is loaded and ready
@@ -215,3 +331,18 @@ def generate(prompt: str, max_new_tokens: int = MAX_NEW_TOKENS, temperature: flo
         str: Generated text response
     """
     return granite_api.generate(prompt, max_new_tokens, temperature)
+
+
+def stream(prompt: str, max_new_tokens: int = MAX_NEW_TOKENS, temperature: float = DEFAULT_TEMPERATURE) -> Iterator[str]:
+    """
+    Convenience function to stream text using the global Granite API instance
+
+    Args:
+        prompt: Input text prompt
+        max_new_tokens: Maximum number of tokens to generate
+        temperature: Sampling temperature
+
+    Yields:
+        str: Pieces of the generated response
+    """
+    return granite_api.stream(prompt, max_new_tokens, temperature)
@@ -2,7 +2,7 @@
 Pydantic request models for API input validation
 """
 from pydantic import BaseModel, Field, validator
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class ChatRequest(BaseModel):
@@ -39,6 +39,10 @@ class GoalRequest(BaseModel):
     income: float = Field(..., gt=0, description="Monthly income")
     persona: str = Field(default="general", description="User persona")
     current_savings: Optional[float] = Field(default=0.0, ge=0, description="Current savings")
+    months_list: Optional[List[int]] = Field(
+        default=None, max_length=3, description="Alternative timelines to plan in the same request (up to 3)"
+    )
+    include_advice: bool = Field(default=True, description="Generate AI advice (set False to get only the plan figures)")
 
     @validator('goal_name')
     def goal_name_not_empty(cls, v):
@@ -46,6 +50,12 @@ class GoalRequest(BaseModel):
             raise ValueError('Goal name cannot be empty')
         return v.strip()
 
+    @validator('months_list')
+    def validate_months_list(cls, v):
+        if v is not None and any(m <= 0 for m in v):
+            raise ValueError('All timelines in months_list must be positive')
+        return v
+
 
 class TransactionRequest(BaseModel):
     """Request model for adding transactions"""
@@ -20,6 +20,7 @@ class GoalResponse(BaseModel):
     """Response model for goal planning"""
     plan: Dict[str, Any]  # Contains goal details and required monthly saving
     advice: str
+    plans: Optional[List[Dict[str, Any]]] = None  # One {plan, advice} entry per months_list timeline
 
 
 class TaxResponse(BaseModel):
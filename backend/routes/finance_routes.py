@@ -2,6 +2,7 @@
 Finance-related API routes
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from datetime import datetime
 import json
@@ -24,10 +25,10 @@ from models.response_models import (
     ErrorResponse
 )
 from agents.budget_agent import analyze_budget
-from agents.goal_agent import plan_goal
+from agents.goal_agent import plan_goal, plan_goal_scenarios, stream_goal_plan
 from agents.tax_agent import get_tax_advice
 from agents.intent_router import route_intent, get_fallback_response
-from core.granite_api import generate
+from core.granite_api import generate, stream
 from core.logger import logger
 from config.settings import DATA_DIR
 from core.database import db
@@ -55,6 +56,36 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
     return user
 
+# Shown when the model gives no usable answer to a chat question
+CHAT_FALLBACK = """I'm here to help with your financial questions! I can assist with:
+
+        - Budget planning and expense tracking
+        - Savings goals and strategies
+        - Investment basics and portfolio allocation
+        - Tax planning and deductions
+        - Debt management
+
+        Please ask a specific question and I'll provide detailed advice."""
+
+
+def _chat_prompt(question: str) -> str:
+    """Create a well-structured prompt for better responses"""
+    return f"""You are a professional financial advisor. Answer the following question with practical and accurate advice.
+
+Question: {question}
+
+Answer:"""
+
+
+# Replies shorter than this are treated as empty or nonsensical
+MIN_CHAT_REPLY_LENGTH = 20
+
+
+def _chat_reply(text: str) -> str:
+    """The text to send for a generated chat reply, with CHAT_FALLBACK for unusable ones"""
+    return text if text and len(text.strip()) >= MIN_CHAT_REPLY_LENGTH else CHAT_FALLBACK
+
+
 @router.post("/ai/generate", response_model=ChatResponse)
 async def generate_ai_response(request: ChatRequest, user=Depends(get_current_user)):
     logger.info(f"AI generate request from user: {user.get('email', 'unknown')} | Question: {request.question}")
@@ -70,14 +101,7 @@ async def generate_ai_response(request: ChatRequest, user=Depends(get_current_us
     try:
         logger.info(f"AI generate request: {request.question[:50]}...")
 
-        # Create a well-structured prompt for better responses
-        prompt = f"""You are a professional financial advisor. Answer the following question with practical and accurate advice.
-
-Question: {request.question}
-
-Answer:"""
-
-        response_text = generate(prompt, max_new_tokens=150, temperature=0.7)
+        response_text = generate(_chat_prompt(request.question), max_new_tokens=150, temperature=0.7)
 
         # Save conversation to MongoDB
         db.conversations.insert_one({
@@ -89,24 +113,61 @@ Answer:"""
         logger.info(f"AI response saved for user: {user.get('email', 'unknown')}")
 
         # If response is too short or nonsensical, provide a fallback
-        if not response_text or len(response_text.strip()) < 20:
-            response_text = """I'm here to help with your financial questions! I can assist with:
-
-        - Budget planning and expense tracking
-        - Savings goals and strategies
-        - Investment basics and portfolio allocation
-        - Tax planning and deductions
-        - Debt management
-
-        Please ask a specific question and I'll provide detailed advice."""
-
-        return ChatResponse(response=response_text)
+        return ChatResponse(response=_chat_reply(response_text))
 
     except Exception as e:
         logger.error(f"AI generate failed for user {user.get('email', 'unknown')}: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/ai/generate/stream")
+async def stream_ai_response(request: ChatRequest, user=Depends(get_current_user)):
+    logger.info(f"AI generate stream from user: {user.get('email', 'unknown')} | Question: {request.question}")
+    """
+    General AI response endpoint that streams the answer as Server-Sent Events
+
+    Args:
+        request: ChatRequest with question and persona
+
+    Returns:
+        StreamingResponse: one data event per JSON-encoded chunk of the
+        answer, then a "done" event (or an "error" event if generation fails)
+    """
+    def events():
+        pieces = []
+        sent = 0  # pieces already sent to the client
+        try:
+            for chunk in stream(_chat_prompt(request.question), max_new_tokens=150, temperature=0.7):
+                pieces.append(chunk)
+                # Hold the reply back until it is long enough to keep, so the
+                # fallback can still replace it
+                if sent or len("".join(pieces).strip()) >= MIN_CHAT_REPLY_LENGTH:
+                    for piece in pieces[sent:]:
+                        yield f"data: {json.dumps(piece)}\n\n"
+                    sent = len(pieces)
+        except Exception as e:
+            logger.error(f"AI generate stream failed for user {user.get('email', 'unknown')}: {str(e)}")
+            # Whatever was sent is incomplete: say so, and don't save it as the reply
+            yield f"event: error\ndata: {json.dumps(str(e))}\n\n"
+            return
+
+        response_text = _chat_reply("".join(pieces))
+        if not sent:
+            # Nothing was sent: the reply was too short, so send the fallback instead
+            yield f"data: {json.dumps(response_text)}\n\n"
+
+        # Save conversation to MongoDB once the whole answer is known
+        db.conversations.insert_one({
+            "user_id": str(user["_id"]),
+            "question": request.question,
+            "response": response_text,
+            "timestamp": datetime.utcnow()
+        })
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/ai/budget-summary", response_model=BudgetResponse)
 async def get_budget_summary(request: BudgetRequest, user=Depends(get_current_user)):
     logger.info(f"Budget analysis request from user: {user.get('email', 'unknown')} | Income: {request.income}")
@@ -153,13 +214,34 @@ async def plan_financial_goal(request: GoalRequest, user=Depends(get_current_use
     try:
         logger.info(f"Goal planning request: {request.goal_name}")
 
+        if request.months_list:
+            plans = plan_goal_scenarios(
+                goal_name=request.goal_name,
+                target_amount=request.target_amount,
+                months_list=request.months_list,
+                income=request.income,
+                persona=request.persona,
+                current_savings=request.current_savings,
+                include_advice=request.include_advice
+            )
+            primary = next(
+                (p for p in plans if p["plan"]["months"] == request.months),
+                plans[0]
+            )
+            return GoalResponse(
+                plan=primary["plan"],
+                advice=primary["advice"],
+                plans=plans
+            )
+
         result = plan_goal(
             goal_name=request.goal_name,
             target_amount=request.target_amount,
             months=request.months,
             income=request.income,
             persona=request.persona,
-            current_savings=request.current_savings
+            current_savings=request.current_savings,
+            include_advice=request.include_advice
         )
 
         return GoalResponse(
@@ -172,6 +254,37 @@ async def plan_financial_goal(request: GoalRequest, user=Depends(get_current_use
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/ai/goal-planner/stream")
+async def stream_financial_goal(request: GoalRequest, user=Depends(get_current_user)):
+    logger.info(f"Goal planning stream from user: {user.get('email', 'unknown')} | Goal: {request.goal_name}")
+    """
+    Goal planning endpoint that streams the advice as Server-Sent Events
+
+    Args:
+        request: GoalRequest with goal details (months_list is ignored)
+
+    Returns:
+        StreamingResponse: a "plan" event with the plan JSON, one data event
+        per JSON-encoded advice chunk, then a "done" event
+    """
+    plan, advice_chunks = stream_goal_plan(
+        goal_name=request.goal_name,
+        target_amount=request.target_amount,
+        months=request.months,
+        income=request.income,
+        persona=request.persona,
+        current_savings=request.current_savings
+    )
+
+    def events():
+        yield f"event: plan\ndata: {json.dumps(plan)}\n\n"
+        for chunk in advice_chunks:
+            yield f"data: {json.dumps(chunk)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @router.post("/ai/tax-advice", response_model=TaxResponse)
 async def get_tax_advisory(request: TaxRequest, user=Depends(get_current_user)):
     logger.info(f"Tax advice request from user: {user.get('email', 'unknown')} | Income: {request.income}")
@@ -9,9 +9,12 @@ from datetime import datetime, timedelta
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.api_client import APIClient
-from utils.session_state import SessionState
-from config.settings import BACKEND_URL
+from utils.api_client import cached_dashboard, cached_health, clear_dashboard, get_api_client, prefetch_ai
+from utils.goal_store import forget_goals
+from utils.session_state import SessionState, clear_state
+from config.settings import (
+    BACKEND_URL, DEFAULT_ANNUAL_INCOME, DEFAULT_EXPENSES, DEFAULT_MONTHLY_INCOME, DEFAULT_PERSONA
+)
 
 # Page configuration
 st.set_page_config(
@@ -112,7 +115,7 @@ st.markdown("""
 
 class FinanceApp:
     def __init__(self):
-        self.api_client = APIClient(BACKEND_URL)
+        self.api_client = get_api_client(BACKEND_URL)
         self.session = SessionState()
 
     def run(self):
@@ -151,6 +154,10 @@ class FinanceApp:
 
                 if st.button("📊 Analyze Spending", use_container_width=True):
                     st.session_state.show_analysis = True
+                    # Start the Budget and Tax Planner answers for their starting inputs,
+                    # so they are ready (or in flight) when those pages open
+                    prefetch_ai(BACKEND_URL, DEFAULT_ANNUAL_INCOME, DEFAULT_MONTHLY_INCOME,
+                                DEFAULT_EXPENSES, DEFAULT_PERSONA)
 
                 if st.button("💡 Get AI Advice", use_container_width=True):
                     st.session_state.show_ai_chat = True
@@ -168,6 +175,17 @@ class FinanceApp:
                     st.checkbox("Enable notifications", value=True, key="notifications")
                     st.checkbox("Email alerts", value=True, key="email_alerts")
 
+                    # How often AI answers come from the cache instead of the backend
+                    stats = self.api_client.get_stats()
+                    lookups = stats["hits"] + stats["misses"]
+                    st.metric(
+                        "AI cache hit rate",
+                        f"{stats['hits'] / lookups:.0%}" if lookups else "—",
+                        help=f"{stats['hits']} hits, {stats['misses']} misses, "
+                             f"{stats['prefetch_hits']} prefetched ({stats['prefetch_misses']} still running), "
+                             f"{stats['bytes_in'] / 1024:,.0f} KB received"
+                    )
+
                 st.divider()
 
                 if st.button("🚪 Logout", use_container_width=True):
@@ -191,6 +209,7 @@ class FinanceApp:
                     if result and result.get("access_token"):
                         st.session_state.authenticated = True
                         st.session_state.username = email.split('@')[0]
+                        st.session_state.user_id = email
                         st.rerun()
                     else:
                         st.error("Invalid email or password")
@@ -218,7 +237,7 @@ class FinanceApp:
         st.title("📊 Dashboard")
 
         # Check backend health
-        if not self.api_client.check_health():
+        if not cached_health(BACKEND_URL):
             st.error("⚠️ Backend server is not running! Please start the backend server at http://localhost:8000")
             st.info("Run: `cd backend && python main.py` to start the backend")
             return
@@ -226,9 +245,9 @@ class FinanceApp:
         st.success("✅ Connected to backend server")
         st.write("Welcome to your financial dashboard powered by AI.")
 
-        # Fetch analytics from backend
+        # Fetch analytics and recent transactions from backend in parallel
         with st.spinner("Loading financial data..."):
-            analytics = self.api_client.get_analytics()
+            transactions, analytics = cached_dashboard(BACKEND_URL, limit=5)
 
         if analytics:
             totals = analytics.get("totals", {})
@@ -295,9 +314,6 @@ class FinanceApp:
         with col2:
             st.subheader("📋 Recent Transactions")
 
-            # Fetch transactions from backend
-            transactions = self.api_client.get_transactions(limit=5)
-
             if transactions:
                 for txn in transactions:
                     desc = txn.get("description", "Unknown")
@@ -339,6 +355,7 @@ class FinanceApp:
                     })
 
                 if result.get("success"):
+                    clear_dashboard()
                     st.success(f"✅ Transaction added successfully! ID: {result.get('transaction_id')}")
                     st.rerun()
                 else:
@@ -353,14 +370,25 @@ class FinanceApp:
 
         if st.button("Get AI Advice", use_container_width=True):
             if user_question:
-                with st.spinner("🤖 AI is thinking..."):
-                    response = self.api_client.get_ai_advice(user_question, persona="professional")
-                st.info(f"**AI Response:** {response}")
+                # Stream the answer so the first words show as soon as they are generated
+                with st.container(border=True):
+                    st.markdown("**AI Response:**")
+                    st.write_stream(self.api_client.stream_ai_advice(user_question, persona="professional"))
             else:
                 st.warning("Please enter a question")
 
     def logout(self):
         """Logout user and reset session"""
+        user_id = st.session_state.get('user_id')
+        if user_id:
+            # Don't keep the user's goals and saved page state around for the next login
+            forget_goals(user_id)
+            clear_state(user_id)
+        # Background AI requests started for this user are no longer wanted
+        pending = list(st.session_state.get('_prefetch', {}).values())
+        pending.append(st.session_state.get('ai_future'))
+        for future in filter(None, pending):
+            future.cancel()
         self.session.reset()
         st.rerun()
 
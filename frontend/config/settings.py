@@ -7,6 +7,9 @@ import os
 # Backend API configuration
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Local storage for per-user data (e.g. saved goals)
+APP_DATA_DIR = os.getenv("APP_DATA_DIR", os.path.join(os.path.expanduser("~"), ".app"))
+
 # App configuration
 APP_TITLE = "Personal Finance Assistant"
 APP_ICON = "💰"
@@ -30,6 +33,21 @@ CHART_COLORS = {
     "danger": "#f5576c"
 }
 
+# Starting inputs of the Budget and Tax Planner pages (also what
+# "Analyze Spending" prefetches AI answers for)
+PERSONAS = ["conservative", "professional", "aggressive"]
+DEFAULT_PERSONA = "conservative"
+DEFAULT_MONTHLY_INCOME = 60000
+DEFAULT_ANNUAL_INCOME = 1200000
+DEFAULT_EXPENSES = {
+    "Housing": 15000,
+    "Food": 10000,
+    "Transportation": 5000,
+    "Entertainment": 3000,
+    "Shopping": 5000,
+    "Other": 2000
+}
+
 # Transaction categories
 TRANSACTION_CATEGORIES = [
     "Food & Dining",
@@ -3,208 +3,591 @@ Goals page - Set and track financial goals with AI recommendations.
 """
 
 import streamlit as st
+import numpy as np
 import plotly.graph_objects as go
+import uuid
 from datetime import datetime, timedelta
-import time
+from types import MappingProxyType
+from utils.api_client import cached_goal_plan, error_message, failed_reply, get_api_client, submit_with_ctx
+from utils.goal_store import get_goals, sample_goals, update_goals
+from utils.session_state import hydrate_state, mirror_state, save_state
+from config.settings import BACKEND_URL, GOAL_CATEGORIES
 
 st.set_page_config(page_title="Goals", page_icon="🎯", layout="wide")
 
-st.title("🎯 Financial Goals")
+CATEGORY_OPTIONS = tuple(GOAL_CATEGORIES)
+CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORY_OPTIONS)}
+GOAL_TYPE_OPTIONS = ("Short Term (<1 year)", "Medium Term (1-3 years)", "Long Term (>3 years)")
+GOAL_TYPE_INDEX = {name: i for i, name in enumerate(GOAL_TYPE_OPTIONS)}
+
+# Initial values for the Create New Goal form widgets (keyed by widget key)
+FORM_DEFAULTS = MappingProxyType({
+    "form_goal_name": "",
+    "form_target_amount": 100000,
+    "form_current_savings": 10000,
+    "form_monthly_income": 60000,
+    "form_goal_type": GOAL_TYPE_OPTIONS[0],
+    "form_category": CATEGORY_OPTIONS[0]
+})
+
+GOAL_CARD_CSS = """
+<style>
+    .goal-bar {
+        background-color: #e2e8f0;
+        border-radius: 0.5rem;
+        height: 0.6rem;
+        overflow: hidden;
+        margin-bottom: 0.5rem;
+    }
+    .goal-bar > div {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        height: 100%;
+    }
+    .goal-stats td {
+        border: none;
+        padding: 0 2rem 0 0;
+    }
+</style>
+"""
 
-# Check authentication
-if not st.session_state.get('authenticated', False):
-    st.warning("Please login to view your goals")
-    st.stop()
+# The gauge is read-only: skip Streamlit's theme merge and Plotly's interactive setup
+GAUGE_CONFIG = {"staticPlot": True, "displayModeBar": False}
 
-# Goal creation section
-with st.expander("➕ Create New Goal", expanded=False):
-    col1, col2 = st.columns(2)
-
-    with col1:
-        goal_name = st.text_input("Goal Name", placeholder="e.g., Dream Vacation")
-        target_amount = st.number_input("Target Amount (₹)", min_value=1000, value=100000, step=1000)
-        current_savings = st.number_input("Current Savings (₹)", min_value=0, value=10000, step=1000)
-
-    with col2:
-        goal_type = st.selectbox("Goal Type", ["Short Term (<1 year)", "Medium Term (1-3 years)", "Long Term (>3 years)"])
-        target_date = st.date_input("Target Date", min_value=datetime.now().date())
-        category = st.selectbox("Category", ["Travel", "Education", "Emergency Fund", "Home", "Car", "Retirement", "Other"])
-
-    # AI-powered planning
-    if st.button("🤖 Get AI Recommendations"):
-        with st.spinner("Analyzing your financial situation..."):
-            time.sleep(2)  # Simulate API call
-
-            st.success("AI Analysis Complete!")
-
-            # Display recommendations
-            st.markdown("### 📊 AI Recommendations")
-
-            tab1, tab2, tab3 = st.tabs(["💚 Easy Plan", "💛 Moderate Plan", "❤️ Aggressive Plan"])
-
-            with tab1:
-                st.markdown("""
-                **Easy Savings Plan** (Minimal lifestyle impact)
-                - **Monthly Savings Required**: ₹8,000
-                - **Time to Goal**: 12 months
-                - **Feasibility**: High ✅
-
-                **How to achieve:**
-                - Reduce dining out by ₹3,200/month
-                - Cut shopping expenses by ₹2,400/month
-                - Optimize subscriptions to save ₹2,400/month
-                """)
-
-                if st.button("Choose Easy Plan", key="easy_plan"):
-                    st.success("Goal created with Easy plan!")
-
-            with tab2:
-                st.markdown("""
-                **Moderate Savings Plan** (Some lifestyle adjustments)
-                - **Monthly Savings Required**: ₹12,000
-                - **Time to Goal**: 8 months
-                - **Feasibility**: Medium ⚠️
-
-                **How to achieve:**
-                - Reduce overall expenses by 10% (₹4,500/month)
-                - Use available savings (₹7,500/month)
-                - Consider part-time income opportunities
-                """)
-
-                if st.button("Choose Moderate Plan", key="moderate_plan"):
-                    st.success("Goal created with Moderate plan!")
-
-            with tab3:
-                st.markdown("""
-                **Aggressive Savings Plan** (Significant changes needed)
-                - **Monthly Savings Required**: ₹18,000
-                - **Time to Goal**: 5 months
-                - **Feasibility**: Challenging ❌
-
-                **How to achieve:**
-                - Cut all non-essential expenses (₹8,000/month)
-                - Use maximum available savings (₹10,000/month)
-                - Additional income required: ₹5,000/month
-                """)
-
-                if st.button("Choose Aggressive Plan", key="aggressive_plan"):
-                    st.success("Goal created with Aggressive plan!")
+# Per-goal text, filled with str.format(**goal, progress=..., remaining=...)
+GOAL_STATS_TEMPLATE = (
+    "<div class='goal-bar'><div style='width:{progress:.1f}%'></div></div>"
+    "<p>Progress: {progress:.1f}% (₹{current:,} / ₹{target:,})</p>"
+    "<table class='goal-stats'><tr>"
+    "<td>Monthly Target<br><b>₹{monthly_required:,}</b></td>"
+    "<td>Remaining<br><b>₹{remaining:,}</b></td>"
+    "</tr></table>"
+)
 
-st.divider()
+DETAIL_TEMPLATE = """**Goal Name:** {name}
 
-# Display active goals
-st.subheader("📋 Your Active Goals")
+**Category:** {category}
 
-# Sample goals data
-goals = [
-    {
-        "name": "Emergency Fund",
-        "target": 300000,
-        "current": 180000,
-        "category": "Emergency Fund",
-        "deadline": "Dec 2025",
-        "monthly_required": 10000
-    },
-    {
-        "name": "Dream Vacation to Europe",
-        "target": 150000,
-        "current": 52500,
-        "category": "Travel",
-        "deadline": "Jun 2025",
-        "monthly_required": 12000
-    },
-    {
-        "name": "New Laptop",
-        "target": 80000,
-        "current": 64000,
-        "category": "Other",
-        "deadline": "Jan 2025",
-        "monthly_required": 8000
-    }
+**Deadline:** {deadline}
+
+**Saved:** ₹{current:,} of ₹{target:,} ({progress:.1f}%)
+
+**Remaining:** ₹{remaining:,}
+
+**Monthly Target:** ₹{monthly_required:,}"""
+
+# Tab label and lifestyle impact for each plan, in months_list order
+PLAN_LABELS = [
+    ("Easy", "Minimal lifestyle impact"),
+    ("Moderate", "Some lifestyle adjustments"),
+    ("Aggressive", "Significant changes needed")
 ]
+PLAN_OPTIONS = ("💚 Easy Plan", "💛 Moderate Plan", "❤️ Aggressive Plan")
+
+
+@st.cache_data(max_entries=256)
+def build_gauge(progress_rounded: int) -> dict:
+    """Build the progress gauge once per integer percentage and cache its spec"""
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=progress_rounded,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#667eea"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 75], 'color': "lightblue"},
+                {'range': [75, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+
+    fig.update_layout(height=200, margin=dict(l=10, r=10, t=10, b=10))
+    return fig.to_dict()
+
+
+def _summarize_plans(plans: list) -> list:
+    """Derive the per-tab display values once, when the AI result arrives"""
+    now = datetime.now()
+    summaries = []
+    for recommendation in plans:
+        plan = recommendation['plan']
+        share = plan['percentage_of_income']
+        summaries.append({
+            **recommendation,
+            'feasibility': "High ✅" if share <= 20 else "Medium ⚠️" if share <= 35 else "Challenging ❌",
+            'deadline': (now + timedelta(days=plan['months'] * 30)).strftime("%b %Y")
+        })
+    return summaries
+
+
+def _cancel_ai():
+    """Drop the pending AI request before the fragment reruns"""
+    future = st.session_state.pop('ai_future', None)
+    if future is not None:
+        future.cancel()
+
+
+@st.fragment(run_every=0.5)
+def _poll_ai_future(user_id: str):
+    """Poll the pending AI request without blocking the rest of the page"""
+    future = st.session_state.get('ai_future')
+    if future is not None and not future.done():
+        st.info("🤖 Analyzing your financial situation...")
+        st.button("Cancel", key="cancel_ai", on_click=_cancel_ai)
+        return
+
+    # Finished or cancelled: keep the outcome, then rerun the whole page, which
+    # no longer renders this fragment and so stops the polling
+    st.session_state.pop('ai_future', None)
+    if future is not None:
+        try:
+            result = future.result()
+        except Exception as e:
+            st.session_state.ai_error = f"Goal planning failed. {error_message(e)}"
+        else:
+            save_state(user_id, 'ai_recommendations', _summarize_plans(result.get('plans', [])))
+            if not st.session_state.ai_recommendations:
+                st.session_state.ai_error = "Failed to generate AI recommendations. Please try again."
+    st.rerun()
+
+
+@st.cache_data
+def _insights(goals_key: tuple) -> tuple:
+    """Build the three Goal Insights blocks from (name, current, target) triples"""
+    on_track, behind, catch_up = [], [], []
+    total_remaining = 0
+    for name, current, target in goals_key:
+        ratio = current / target
+        total_remaining += max(target - current, 0)
+        if ratio >= 0.5:
+            on_track.append(f"- {name} ({ratio:.0%})")
+        else:
+            behind.append(f"- {name} ({ratio:.0%})")
+            catch_up.append((target // 2 - current, name))
+
+    on_track_md = "**🎯 On Track Goals**\n" + ("\n".join(on_track) or "- None yet")
+    if on_track:
+        on_track_md += "\n\nYou're making great progress!"
+
+    needs_attention_md = "**⚠️ Needs Attention**\n" + ("\n".join(behind) or "- Nothing right now")
+    if behind:
+        needs_attention_md += "\n\nConsider increasing monthly contributions to stay on track."
+
+    tips = [f"- Add ₹{gap:,.0f} to {name} to reach the halfway mark" for gap, name in sorted(catch_up, reverse=True)]
+    if total_remaining:
+        tips.append(f"- ₹{total_remaining:,.0f} left to save across all goals")
+    recommendations_md = "**📈 Recommendations**\n" + ("\n".join(tips) or "- Keep your current contributions going")
+
+    return on_track_md, needs_attention_md, recommendations_md
+
+
+def _savings_curve(recommendations: list) -> go.Figure:
+    """Monthly saving needed for every timeline up to twice the longest plan, with the plans marked"""
+    remaining = recommendations[0]['plan']['remaining_amount']
+    plan_months = np.array([r['plan']['months'] for r in recommendations])
+    curve_months = np.arange(1, plan_months.max() * 2 + 1)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=curve_months,
+        y=remaining / curve_months,
+        mode='lines',
+        name='Monthly Saving Needed',
+        line=dict(color='#667eea', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=plan_months,
+        y=remaining / plan_months,
+        mode='markers+text',
+        name='Plans',
+        text=[label for label, _ in PLAN_LABELS],
+        textposition='top center',
+        marker=dict(color='#f5576c', size=10)
+    ))
+
+    fig.update_layout(
+        xaxis_title="Months",
+        yaxis_title="Monthly Saving (₹)",
+        height=300,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0.02)',
+        showlegend=False
+    )
+    return fig
+
+
+def _collect(chunks: list, stream):
+    """Pass a stream through, keeping its chunks"""
+    for chunk in stream:
+        chunks.append(chunk)
+        yield chunk
+
+
+@st.fragment
+def _render_plan(label: str, impact: str, recommendation: dict, category: str, income: float, user_id: str):
+    """Render the selected plan; its buttons rerun only this fragment until a goal is created"""
+    plan = recommendation['plan']
+
+    st.markdown(f"""
+    **{label} Savings Plan** ({impact})
+    - **Monthly Savings Required**: ₹{plan['monthly_savings_needed']:,.0f}
+    - **Time to Goal**: {plan['months']} months
+    - **Target Date**: {recommendation['deadline']}
+    - **Share of Income**: {plan['percentage_of_income']:.1f}%
+    - **Feasibility**: {recommendation['feasibility']}
+    """)
+    if recommendation['advice']:
+        st.info(f"**💡 AI Advice:**\n\n{recommendation['advice']}")
+    elif st.button("💡 Get AI Advice", key=f"{label.lower()}_advice"):
+        # Plans arrive without advice; stream it in on request and keep it on the stored plan
+        st.markdown("**💡 AI Advice:**")
+        chunks = []
+        st.write_stream(_collect(chunks, get_api_client(BACKEND_URL).stream_goal_plan(
+            goal_name=plan['goal_name'],
+            target_amount=plan['target_amount'],
+            months=plan['months'],
+            income=income,
+            current_savings=plan['current_savings']
+        )))
+        # A failed stream ends with its error message; don't keep that as advice
+        if chunks and not failed_reply(chunks[-1]):
+            recommendation['advice'] = "".join(chunks)
+
+    if st.button(f"Choose {label} Plan", key=f"{label.lower()}_plan"):
+        goal = {
+            "id": uuid.uuid4().hex,
+            "target": int(plan['target_amount']),
+            "current": int(plan['current_savings']),
+            "category": category,
+            "deadline": recommendation['deadline'],
+            "monthly_required": round(plan['monthly_savings_needed'])
+        }
+
+        def add_goal(goals: dict):
+            # Don't replace an existing goal of the same name; number the new one instead
+            name = plan['goal_name']
+            copy = 2
+            while name in goals:
+                name = f"{plan['goal_name']} ({copy})"
+                copy += 1
+            goals[name] = {**goal, "name": name}
+
+        st.session_state.goals = update_goals(user_id, add_goal)
+        name = next(n for n, g in st.session_state.goals.items() if g['id'] == goal['id'])
+        if name != plan['goal_name']:
+            st.toast(f"A goal named '{plan['goal_name']}' already exists, so this one is '{name}'")
+        st.toast(f"Goal created with {label} plan!")
+        # The new goal shows up in the list below, outside this fragment
+        st.rerun()
+
+
+def init_form_defaults():
+    """Seed the Create New Goal form state, resetting selections no longer offered"""
+    for key, value in FORM_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    if st.session_state.form_goal_type not in GOAL_TYPE_INDEX:
+        st.session_state.form_goal_type = FORM_DEFAULTS["form_goal_type"]
+    if st.session_state.form_category not in CATEGORY_INDEX:
+        st.session_state.form_category = FORM_DEFAULTS["form_category"]
+
+
+@st.cache_data(max_entries=256)
+def svg_gauge(pct_rounded: int) -> str:
+    """Half-circle SVG progress gauge, a few hundred bytes instead of a Plotly figure"""
+    arc = "M10 50 A40 40 0 0 1 90 50"
+    filled = 125.66 * pct_rounded / 100  # half-circumference of r=40
+    color = "#84fab0" if pct_rounded >= 75 else "#667eea"
+    return (
+        "<svg viewBox='0 0 100 60' width='100%' height='120'>"
+        f"<path d='{arc}' fill='none' stroke='#e2e8f0' stroke-width='10'/>"
+        f"<path d='{arc}' fill='none' stroke='{color}' stroke-width='10' "
+        f"stroke-dasharray='{filled:.2f} 126'/>"
+        f"<text x='50' y='48' text-anchor='middle' font-size='14' font-weight='bold'>{pct_rounded}%</text>"
+        "</svg>"
+    )
+
+
+def _close_panel(goal_id: str):
+    """Close a goal's panel before the rerun renders it"""
+    st.session_state.goal_ui[goal_id]['mode'] = None
+
+
+# Goal mutations run as widget callbacks, before the rerun, so a single run
+# renders the updated list instead of needing an extra st.rerun(). They go
+# through update_goals, which applies them to the store the user's other
+# sessions share, and each goal is replaced rather than edited in place.
+def _add_contribution(name: str, user_id: str):
+    gid = st.session_state.goals[name]['id']
+    amount = st.session_state[f"contrib_amount_{gid}"]
+
+    def add(goals: dict):
+        if name in goals:
+            goals[name] = {**goals[name], "current": goals[name]['current'] + amount}
+
+    st.session_state.goals = update_goals(user_id, add)
+    _close_panel(gid)
+
+
+def _save_goal(name: str, user_id: str):
+    gid = st.session_state.goals[name]['id']
+    new_name = st.session_state[f"edit_name_{gid}"] or name
+    ui = st.session_state.goal_ui[gid]
+
+    def save(goals: dict):
+        if name not in goals:
+            return
+        if new_name != name and new_name in goals:
+            ui['error'] = f"A goal named '{new_name}' already exists"
+            return
+        goal = {
+            **goals.pop(name),
+            "name": new_name,
+            "target": st.session_state[f"edit_target_{gid}"],
+            "category": st.session_state[f"edit_category_{gid}"],
+            "monthly_required": st.session_state[f"edit_monthly_{gid}"]
+        }
+        goals[new_name] = goal
+
+    st.session_state.goals = update_goals(user_id, save)
+    if 'error' not in ui:
+        _close_panel(gid)
+
+
+def _delete_goal(name: str, user_id: str):
+    gid = st.session_state.goals[name]['id']
+    st.session_state.goals = update_goals(user_id, lambda goals: goals.pop(name, None))
+    st.session_state.goal_ui.pop(gid, None)
+
+
+def _load_sample_goals(user_id: str):
+    """Add the demo goals before the rerun renders the list"""
+    samples = sample_goals()
+    st.session_state.goals = update_goals(user_id, lambda goals: goals.update(samples))
+
+
+@st.fragment
+def _render_goal_card(name: str, user_id: str):
+    """Render one goal; its buttons rerun only this card"""
+    goal = st.session_state.goals.get(name)
+    if goal is None:
+        # Renamed or deleted by this card's callback: the list itself changed
+        st.rerun()
+
+    # Widget keys and panel state use the goal's id, which survives renames
+    gid = goal['id']
+    ui = st.session_state.goal_ui.setdefault(gid, {'mode': None})
 
-for goal in goals:
     with st.container():
-        col1, col2, col3 = st.columns([2, 1, 1])
+        col1, col2 = st.columns([3, 1])
 
         with col1:
             st.markdown(f"### {goal['name']}")
             st.caption(f"Category: {goal['category']} | Deadline: {goal['deadline']}")
 
-            # Progress bar
-            progress = (goal['current'] / goal['target']) * 100
-            st.progress(progress / 100)
-            st.write(f"Progress: {progress:.1f}% (₹{goal['current']:,} / ₹{goal['target']:,})")
+            # Progress bar, progress line and targets as a single element
+            progress = min((goal['current'] / goal['target']) * 100, 100)
+            remaining = goal['target'] - goal['current']
+            st.markdown(
+                GOAL_STATS_TEMPLATE.format(**goal, progress=progress, remaining=remaining),
+                unsafe_allow_html=True
+            )
 
         with col2:
-            st.metric("Monthly Target", f"₹{goal['monthly_required']:,}")
-            remaining = goal['target'] - goal['current']
-            st.metric("Remaining", f"₹{remaining:,}")
-
-        with col3:
-            # Gauge chart for progress
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=progress,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                gauge={
-                    'axis': {'range': [None, 100]},
-                    'bar': {'color': "#667eea"},
-                    'steps': [
-                        {'range': [0, 50], 'color': "lightgray"},
-                        {'range': [50, 75], 'color': "lightblue"},
-                        {'range': [75, 100], 'color': "lightgreen"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 90
-                    }
-                }
-            ))
-
-            fig.update_layout(height=200, margin=dict(l=10, r=10, t=10, b=10))
-            st.plotly_chart(fig, use_container_width=True)
+            # Lightweight SVG gauge; the Plotly gauge is kept for View Details
+            st.markdown(svg_gauge(int(progress)), unsafe_allow_html=True)
 
         col_a, col_b, col_c = st.columns(3)
         with col_a:
-            if st.button("💰 Add Contribution", key=f"add_{goal['name']}"):
-                st.info("Contribution form will appear here")
+            if st.button("💰 Add Contribution", key=f"add_{gid}"):
+                ui['mode'] = None if ui['mode'] == 'contrib' else 'contrib'
         with col_b:
-            if st.button("✏️ Edit Goal", key=f"edit_{goal['name']}"):
-                st.info("Edit form will appear here")
+            if st.button("✏️ Edit Goal", key=f"edit_{gid}"):
+                ui['mode'] = None if ui['mode'] == 'edit' else 'edit'
         with col_c:
-            if st.button("📊 View Details", key=f"view_{goal['name']}"):
-                st.info("Detailed view will appear here")
+            show_details = st.button("📊 View Details", key=f"view_{gid}")
+
+        # Contribution form
+        if ui['mode'] == 'contrib':
+            st.number_input(
+                "Contribution Amount (₹)", min_value=0, value=5000, step=500, key=f"contrib_amount_{gid}"
+            )
+            col_submit, col_cancel = st.columns(2)
+            with col_submit:
+                st.button("✅ Submit Contribution", key=f"submit_contrib_{gid}",
+                          on_click=_add_contribution, args=(name, user_id))
+            with col_cancel:
+                st.button("Cancel", key=f"cancel_contrib_{gid}", on_click=_close_panel, args=(gid,))
+
+        # Edit form
+        if ui['mode'] == 'edit':
+            with st.form(f"edit_form_{gid}"):
+                st.text_input("Goal Name", value=goal['name'], key=f"edit_name_{gid}")
+                st.number_input(
+                    "Target Amount (₹)", min_value=1000, value=int(goal['target']), step=1000, key=f"edit_target_{gid}"
+                )
+                st.selectbox(
+                    "Category",
+                    CATEGORY_OPTIONS,
+                    index=CATEGORY_INDEX.get(goal['category'], 0),
+                    key=f"edit_category_{gid}"
+                )
+                st.number_input(
+                    "Monthly Target (₹)", min_value=0, value=int(goal['monthly_required']), step=500,
+                    key=f"edit_monthly_{gid}"
+                )
+
+                col_save, col_delete = st.columns(2)
+                with col_save:
+                    st.form_submit_button("💾 Save Changes", on_click=_save_goal, args=(name, user_id))
+                with col_delete:
+                    st.form_submit_button("🗑️ Delete Goal", on_click=_delete_goal, args=(name, user_id))
+
+            if 'error' in ui:
+                st.error(ui.pop('error'))
+
+        # Goal details
+        if show_details:
+            col_info, col_gauge = st.columns([2, 1])
+            with col_gauge:
+                st.plotly_chart(build_gauge(int(progress)), use_container_width=True,
+                                theme=None, config=GAUGE_CONFIG)
+            col_info.info(DETAIL_TEMPLATE.format(**goal, progress=progress, remaining=remaining))
 
         st.divider()
 
+
+st.title("🎯 Financial Goals")
+
+# Check authentication
+if not st.session_state.get('authenticated', False):
+    st.warning("Please login to view your goals")
+    st.stop()
+
+# Goals are keyed by name so lookups, updates and deletes are O(1).
+# This is a snapshot of the store shared with the user's other sessions,
+# so take a fresh one each run.
+user_id = st.session_state.get('user_id')
+if not user_id:
+    st.warning("Please log in again to load your goals")
+    st.stop()
+st.session_state.goals = get_goals(user_id)
+
+# Bring back the last form inputs and AI plans if the session was restarted
+hydrate_state(user_id)
+
+# Goal creation section
+init_form_defaults()
+today = datetime.now().date()
+
+with st.expander("➕ Create New Goal", expanded=False):
+    # Batch the inputs so editing a field doesn't rerun the whole page
+    with st.form("create_goal_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            goal_name = st.text_input("Goal Name", placeholder="e.g., Dream Vacation", key="form_goal_name")
+            target_amount = st.number_input("Target Amount (₹)", min_value=1000, step=1000, key="form_target_amount")
+            current_savings = st.number_input("Current Savings (₹)", min_value=0, step=1000, key="form_current_savings")
+            monthly_income = st.number_input("Monthly Income (₹)", min_value=1000, step=5000, key="form_monthly_income")
+
+        with col2:
+            goal_type = st.selectbox("Goal Type", GOAL_TYPE_OPTIONS, key="form_goal_type")
+            target_date = st.date_input("Target Date", min_value=today, key="form_target_date")
+            category = st.selectbox("Category", CATEGORY_OPTIONS, key="form_category")
+
+        submitted = st.form_submit_button("🤖 Get AI Recommendations")
+
+    # AI-powered planning: all three scenarios come back from one backend call
+    if submitted:
+        if not goal_name:
+            st.warning("Please enter a goal name")
+        else:
+            mirror_state(user_id, *FORM_DEFAULTS)
+
+            months_until_target = max(1, (target_date - today).days // 30)
+            easy_months = months_until_target + max(1, months_until_target // 2)
+            aggressive_months = max(1, months_until_target * 2 // 3)
+
+            # Fetch the plan figures off the script thread (the fragment below polls it);
+            # the selected plan streams its AI advice when the user asks for it
+            save_state(user_id, 'ai_recommendations', [])
+            st.session_state.ai_future = submit_with_ctx(
+                cached_goal_plan,
+                BACKEND_URL,
+                goal_name=goal_name,
+                target_amount=target_amount,
+                months=months_until_target,
+                income=monthly_income,
+                months_list=(easy_months, months_until_target, aggressive_months),
+                current_savings=current_savings,
+                include_advice=False
+            )
+
+    if 'ai_future' in st.session_state:
+        _poll_ai_future(user_id)
+    if 'ai_error' in st.session_state:
+        st.error(st.session_state.pop('ai_error'))
+
+    if st.session_state.get('ai_recommendations'):
+        st.success("AI Analysis Complete!")
+
+        # Display recommendations
+        st.markdown("### 📊 AI Recommendations")
+
+        # Only the selected plan is rendered (tabs would run all three every time)
+        selected = st.radio(
+            "Plan",
+            range(len(st.session_state.ai_recommendations)),
+            format_func=PLAN_OPTIONS.__getitem__,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="selected_plan"
+        )
+        label, impact = PLAN_LABELS[selected]
+        _render_plan(label, impact, st.session_state.ai_recommendations[selected], category, monthly_income, user_id)
+
+        with st.expander("📈 Timeline vs Monthly Savings"):
+            st.plotly_chart(_savings_curve(st.session_state.ai_recommendations), use_container_width=True)
+
+st.divider()
+
+# Display active goals
+st.subheader("📋 Your Active Goals")
+
+# Styles for the per-goal progress block (re-emitted each run, since reruns rebuild the page)
+st.markdown(GOAL_CARD_CSS, unsafe_allow_html=True)
+
+# Per-goal panel state, keyed by goal id: mode is None, "contrib" or "edit"
+if 'goal_ui' not in st.session_state:
+    st.session_state.goal_ui = {}
+
+if not st.session_state.goals:
+    st.info("No goals yet. Create one above, or load a few samples to explore.")
+    st.button("Load sample goals", on_click=_load_sample_goals, args=(user_id,))
+
+for name in list(st.session_state.goals):
+    _render_goal_card(name, user_id)
+
 # Goals insights
 st.subheader("💡 Goal Insights")
 
+on_track, needs_attention, recommendations = _insights(
+    tuple((name, goal['current'], goal['target']) for name, goal in st.session_state.goals.items())
+)
+
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    st.markdown("""
-    **🎯 On Track Goals**
-    - Emergency Fund (60%)
-    - New Laptop (80%)
-
-    You're making great progress!
-    """)
+    st.markdown(on_track)
 
 with col2:
-    st.markdown("""
-    **⚠️ Needs Attention**
-    - Dream Vacation (35%)
-
-    Consider increasing monthly contributions by ₹3,000 to stay on track.
-    """)
+    st.markdown(needs_attention)
 
 with col3:
-    st.markdown("""
-    **📈 Recommendations**
-    - Increase savings rate by 5%
-    - Cut discretionary spending by ₹2,000/month
-    - Consider side income opportunities
-    """)
+    st.markdown(recommendations)
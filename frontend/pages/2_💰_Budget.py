@@ -3,21 +3,60 @@ Budget Analysis Page - AI-powered budget insights
 """
 
 import streamlit as st
-from utils.api_client import APIClient
-from config.settings import BACKEND_URL
+from utils.api_client import cached_health, cached_budget_analysis, error_message
+from config.settings import BACKEND_URL, DEFAULT_EXPENSES, DEFAULT_MONTHLY_INCOME, DEFAULT_PERSONA, PERSONAS
 import plotly.graph_objects as go
 import plotly.express as px
 
 st.set_page_config(page_title="Budget Analysis", page_icon="💰", layout="wide")
 
-# Initialize API client
-api_client = APIClient(BACKEND_URL)
+
+@st.cache_data(max_entries=64)
+def build_expense_charts(labels: tuple, values: tuple) -> tuple:
+    """Build the pie and bar expense charts once per set of expense values"""
+    # Pie chart
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=labels,
+        values=values,
+        hole=0.4,
+        marker=dict(colors=['#667eea', '#764ba2', '#84fab0', '#8fd3f4', '#f093fb', '#feca57'])
+    )])
+
+    fig_pie.update_layout(
+        title="Expense Distribution",
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+
+    # Bar chart
+    fig_bar = go.Figure(data=[
+        go.Bar(
+            x=labels,
+            y=values,
+            marker_color='#667eea'
+        )
+    ])
+
+    fig_bar.update_layout(
+        title="Expenses by Category",
+        xaxis_title="Category",
+        yaxis_title="Amount (₹)",
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0.02)'
+    )
+
+    return fig_pie.to_dict(), fig_bar.to_dict()
+
 
 st.title("💰 Budget Analysis")
 
 # Check backend connection
-if not api_client.check_health():
+if not cached_health(BACKEND_URL):
     st.error("⚠️ Backend server is not running! Please start it at http://localhost:8000")
+    if st.button("🔄 Reconnect"):
+        cached_health.clear()
+        st.rerun()
     st.stop()
 
 st.write("Analyze your spending patterns and get AI-powered insights to optimize your budget.")
@@ -25,26 +64,30 @@ st.write("Analyze your spending patterns and get AI-powered insights to optimize
 # Budget input section
 st.subheader("📝 Enter Your Budget Details")
 
-col1, col2 = st.columns([1, 2])
+# Batch the inputs so editing a field doesn't rerun the whole page
+with st.form("budget_form"):
+    col1, col2 = st.columns([1, 2])
 
-with col1:
-    monthly_income = st.number_input("Monthly Income (₹)", min_value=0, value=60000, step=5000)
-    persona = st.selectbox("Financial Profile", ["conservative", "professional", "aggressive"])
+    with col1:
+        monthly_income = st.number_input("Monthly Income (₹)", min_value=0, value=DEFAULT_MONTHLY_INCOME, step=5000)
+        persona = st.selectbox("Financial Profile", PERSONAS, index=PERSONAS.index(DEFAULT_PERSONA))
 
-with col2:
-    st.markdown("**Monthly Expenses by Category:**")
+    with col2:
+        st.markdown("**Monthly Expenses by Category:**")
+
+        col_a, col_b = st.columns(2)
 
-    col_a, col_b = st.columns(2)
+        with col_a:
+            housing = st.number_input("Housing", min_value=0, value=DEFAULT_EXPENSES["Housing"], step=1000)
+            food = st.number_input("Food & Dining", min_value=0, value=DEFAULT_EXPENSES["Food"], step=500)
+            transport = st.number_input("Transportation", min_value=0, value=DEFAULT_EXPENSES["Transportation"], step=500)
 
-    with col_a:
-        housing = st.number_input("Housing", min_value=0, value=15000, step=1000)
-        food = st.number_input("Food & Dining", min_value=0, value=10000, step=500)
-        transport = st.number_input("Transportation", min_value=0, value=5000, step=500)
+        with col_b:
+            entertainment = st.number_input("Entertainment", min_value=0, value=DEFAULT_EXPENSES["Entertainment"], step=500)
+            shopping = st.number_input("Shopping", min_value=0, value=DEFAULT_EXPENSES["Shopping"], step=500)
+            other = st.number_input("Other", min_value=0, value=DEFAULT_EXPENSES["Other"], step=500)
 
-    with col_b:
-        entertainment = st.number_input("Entertainment", min_value=0, value=3000, step=500)
-        shopping = st.number_input("Shopping", min_value=0, value=5000, step=500)
-        other = st.number_input("Other", min_value=0, value=2000, step=500)
+    st.form_submit_button("📊 Update Budget", use_container_width=True)
 
 expenses = {
     "Housing": housing,
@@ -55,7 +98,10 @@ expenses = {
     "Other": other
 }
 
-total_expenses = sum(expenses.values())
+# Split once; labels/values feed the metrics, charts and category analysis
+labels, values = zip(*expenses.items())
+
+total_expenses = sum(values)
 savings = monthly_income - total_expenses
 
 # Quick metrics
@@ -77,11 +123,16 @@ if st.button("🤖 Get AI Budget Analysis", use_container_width=True, type="prim
 
     with st.spinner("AI is analyzing your budget..."):
         # Call backend AI budget analysis
-        result = api_client.get_budget_analysis(
-            income=monthly_income,
-            expenses=expenses,
-            persona=persona
-        )
+        try:
+            result = cached_budget_analysis(
+                BACKEND_URL,
+                income=monthly_income,
+                expenses=expenses,
+                persona=persona
+            )
+        except Exception as e:
+            result = None
+            st.error(error_message(e))
 
     if result:
         # Display summary
@@ -92,7 +143,7 @@ if st.button("🤖 Get AI Budget Analysis", use_container_width=True, type="prim
         # Display insights
         if "insights" in result:
             st.info(f"**💡 AI Insights & Recommendations:**\n\n{result['insights']}")
-    else:
+    elif result is not None:
         st.error("Failed to get budget analysis. Please try again.")
 
 # Expense breakdown visualization
@@ -101,43 +152,13 @@ st.subheader("📊 Expense Breakdown")
 
 col1, col2 = st.columns(2)
 
-with col1:
-    # Pie chart
-    fig_pie = go.Figure(data=[go.Pie(
-        labels=list(expenses.keys()),
-        values=list(expenses.values()),
-        hole=0.4,
-        marker=dict(colors=['#667eea', '#764ba2', '#84fab0', '#8fd3f4', '#f093fb', '#feca57'])
-    )])
-
-    fig_pie.update_layout(
-        title="Expense Distribution",
-        height=400,
-        paper_bgcolor='rgba(0,0,0,0)'
-    )
+fig_pie, fig_bar = build_expense_charts(labels, values)
 
-    st.plotly_chart(fig_pie, use_container_width=True)
+with col1:
+    st.plotly_chart(go.Figure(fig_pie), use_container_width=True)
 
 with col2:
-    # Bar chart
-    fig_bar = go.Figure(data=[
-        go.Bar(
-            x=list(expenses.keys()),
-            y=list(expenses.values()),
-            marker_color='#667eea'
-        )
-    ])
-
-    fig_bar.update_layout(
-        title="Expenses by Category",
-        xaxis_title="Category",
-        yaxis_title="Amount (₹)",
-        height=400,
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0.02)'
-    )
-
-    st.plotly_chart(fig_bar, use_container_width=True)
+    st.plotly_chart(go.Figure(fig_bar), use_container_width=True)
 
 # Budgeting tips
 st.divider()
@@ -174,7 +195,7 @@ with col3:
     """)
 
 # Category recommendations
-expense_percentages = {k: (v/monthly_income*100) if monthly_income > 0 else 0 for k, v in expenses.items()}
+expense_percentages = {k: (v/monthly_income*100) if monthly_income > 0 else 0 for k, v in zip(labels, values)}
 
 st.divider()
 st.subheader("⚠️ Category Analysis")
@@ -3,29 +3,126 @@ API client for communicating with the backend server.
 Updated to match FastAPI backend endpoints.
 """
 
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import httpx
 import requests
-from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+@st.cache_resource
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Long-lived event loop on a daemon thread; async clients stay bound to it"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+def run_async(*aws: Awaitable) -> list:
+    """Run awaitables concurrently on the shared loop and return their results in order"""
+    async def _gather():
+        return await asyncio.gather(*aws)
+    return asyncio.run_coroutine_threadsafe(_gather(), _event_loop()).result()
+
+
+@st.cache_resource
+def _pool() -> ThreadPoolExecutor:
+    """Shared worker pool for slow AI requests"""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+@st.cache_resource
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Single worker for speculative prefetches, so they never hold up _pool() work"""
+    return ThreadPoolExecutor(max_workers=1)
+
+
+def _run_with_ctx(ctx, fn, *args, **kwargs):
+    """Run fn on a pool thread with the submitting session's script context attached"""
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return fn(*args, **kwargs)
+
+
+def submit_with_ctx(fn: Callable, *args, **kwargs) -> Future:
+    """Run fn on the shared pool; it may use st.session_state and st.cache_* like script code"""
+    return _pool().submit(_run_with_ctx, get_script_run_ctx(), fn, *args, **kwargs)
+
+
+class _Metrics:
+    """One session's counters for the AI caches and bytes received from the backend"""
+
+    def __init__(self):
+        self.hits = self.misses = self.prefetch_hits = self.prefetch_misses = self.bytes_in = 0
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int):
+        # Pool threads update the session's counters too
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "prefetch_hits": self.prefetch_hits,
+                    "prefetch_misses": self.prefetch_misses, "bytes_in": self.bytes_in}
+
+
+def _metrics() -> _Metrics:
+    """The current session's counters (a throwaway set on threads without a session)"""
+    if get_script_run_ctx() is None:
+        return _Metrics()
+    return st.session_state.setdefault("_metrics", _Metrics())
+
+
+def _count_bytes(response: requests.Response, *args, stream: bool = False, **kwargs):
+    """requests response hook; streamed bodies are counted as they are read"""
+    if not stream:
+        _metrics().add(bytes_in=len(response.content))
 
 
 class APIClient:
+    # AI requests currently on the wire, shared by identical concurrent calls
+    _inflight: Dict[str, Future] = {}
+    _inflight_lock = threading.Lock()
+
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
         self.session.timeout = 30  # 30 seconds timeout
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Keep more warm connections per host and retry transient gateway errors.
+        # Only GETs are retried: the POSTs store records and run the model, so a
+        # retry after the server already handled one would duplicate both.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                              allowed_methods=["GET"])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.hooks["response"].append(_count_bytes)
+        # Health checks get a session without retries, so a down backend is reported at once
+        self.health_session = requests.Session()
+        self.health_session.hooks["response"].append(_count_bytes)
+        self._async_client = None
 
     def _get_headers(self) -> dict:
-        """Get headers for API requests, including JWT if available"""
-        headers = {"Content-Type": "application/json"}
+        """Per-user headers for API requests: the JWT, if available (Content-Type is set on the session)"""
         token = st.session_state.get("auth_token")
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        return headers
+        return {"Authorization": f"Bearer {token}"} if token else {}
 
     def check_health(self) -> bool:
         """Check if backend is running"""
         try:
-            response = self.session.get(f"{self.base_url}/", timeout=5)
+            response = self.health_session.get(f"{self.base_url}/", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -33,13 +130,75 @@ class APIClient:
     def get_health_status(self) -> Dict:
         """Get detailed health status"""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            response = self.health_session.get(f"{self.base_url}/health", timeout=5)
+            if response.status_code == 200:
+                return response.json()
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+        return {"status": "unknown"}
+
+    # ========== Async Variants (await via run_async) ==========
+    # These run on the background loop, which has no script context, so they
+    # never touch st.* and return the same fallbacks as their sync versions.
+    # Anything they need from the session (headers, counters) is read by the
+    # plain def that creates the coroutine, on the script thread.
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """Pooled httpx client, created lazily on first async call"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(30.0, read=60.0),
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+            )
+        return self._async_client
+
+    async def acheck_health(self) -> bool:
+        """Async check_health"""
+        try:
+            response = await self.async_client.get("/", timeout=5)
+            return response.status_code == 200
+        except Exception:
+            return False
+
+    async def aget_health_status(self) -> Dict:
+        """Async get_health_status"""
+        try:
+            response = await self.async_client.get("/health", timeout=5)
             if response.status_code == 200:
                 return response.json()
         except Exception as e:
             return {"status": "error", "error": str(e)}
         return {"status": "unknown"}
 
+    def aget_transactions(self, limit: int = 10) -> Awaitable[List[Dict]]:
+        """Async get_transactions; headers are read here, on the script thread"""
+        return self._aget_transactions(self._get_headers(), _metrics(), limit)
+
+    async def _aget_transactions(self, headers: dict, metrics: _Metrics, limit: int) -> List[Dict]:
+        data = await self._aget("/transactions/recent", headers, metrics)
+        return data.get("transactions", [])[:limit]
+
+    def aget_analytics(self) -> Awaitable[Dict]:
+        """Async get_analytics; headers are read here, on the script thread"""
+        return self._aget("/analytics/summary", self._get_headers(), _metrics())
+
+    def fetch_dashboard(self, limit: int = 10) -> Tuple[List[Dict], Dict]:
+        """Recent transactions and analytics summary, fetched concurrently"""
+        transactions, analytics = run_async(self.aget_transactions(limit), self.aget_analytics())
+        return transactions, analytics
+
+    async def _aget(self, path: str, headers: dict, metrics: _Metrics) -> Dict:
+        try:
+            response = await self.async_client.get(path, headers=headers)
+            metrics.add(bytes_in=len(response.content))
+            if response.status_code == 200:
+                return response.json()
+        except Exception:
+            pass
+        return {}
+
     # ========== Transaction Management ==========
 
     def get_transactions(self, limit: int = 10) -> List[Dict]:
@@ -90,10 +249,9 @@ class APIClient:
     def get_ai_advice(self, question: str, persona: str = "professional") -> str:
         """Get general AI financial advice"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/ai/generate",
-                headers=self._get_headers(),
-                json={"question": question, "persona": persona},
+            response = self._post_single_flight(
+                "/ai/generate",
+                {"question": question, "persona": persona},
                 timeout=60  # AI calls can take longer
             )
             if response.status_code == 200:
@@ -105,17 +263,21 @@ class APIClient:
             st.error(f"AI request failed: {str(e)}")
             return f"Error: {str(e)}"
 
+    def fetch_budget_analysis(self, income: float, expenses: Dict[str, float],
+                              persona: str = "professional") -> Dict:
+        """AI-powered budget analysis, raising on failure (no st.* calls, so safe off the script thread)"""
+        response = self._post_single_flight(
+            "/ai/budget-summary",
+            {"income": income, "expenses": expenses, "persona": persona},
+            timeout=60
+        )
+        response.raise_for_status()
+        return response.json()
+
     def get_budget_analysis(self, income: float, expenses: Dict[str, float], persona: str = "professional") -> Dict:
         """Get AI-powered budget analysis"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/ai/budget-summary",
-                headers=self._get_headers(),
-                json={"income": income, "expenses": expenses, "persona": persona},
-                timeout=60
-            )
-            if response.status_code == 200:
-                return response.json()
+            return self.fetch_budget_analysis(income, expenses, persona)
         except requests.exceptions.Timeout:
             st.warning("Request timed out. The AI model might be loading.")
             return {}
@@ -123,24 +285,41 @@ class APIClient:
             st.error(f"Budget analysis failed: {str(e)}")
         return {}
 
+    def fetch_goal_plan(self, goal_name: str, target_amount: float, months: int,
+                        income: float, persona: str = "professional",
+                        months_list: Optional[List[int]] = None,
+                        current_savings: float = 0.0,
+                        include_advice: bool = True) -> Dict:
+        """
+        AI-powered goal plan (one per timeline in months_list, if given), raising on
+        failure (no st.* calls, so safe off the script thread)
+        """
+        payload = {
+            "goal_name": goal_name,
+            "target_amount": target_amount,
+            "months": months,
+            "income": income,
+            "persona": persona,
+            "current_savings": current_savings
+        }
+        if months_list:
+            payload["months_list"] = months_list
+        if not include_advice:
+            payload["include_advice"] = False
+
+        response = self._post_single_flight("/ai/goal-planner", payload, timeout=60)
+        response.raise_for_status()
+        return response.json()
+
     def create_goal_plan(self, goal_name: str, target_amount: float, months: int,
-                        income: float, persona: str = "professional") -> Dict:
-        """Create AI-powered goal plan"""
+                        income: float, persona: str = "professional",
+                        months_list: Optional[List[int]] = None,
+                        current_savings: float = 0.0,
+                        include_advice: bool = True) -> Dict:
+        """Create AI-powered goal plan (one per timeline in months_list, if given)"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/ai/goal-planner",
-                headers=self._get_headers(),
-                json={
-                    "goal_name": goal_name,
-                    "target_amount": target_amount,
-                    "months": months,
-                    "income": income,
-                    "persona": persona
-                },
-                timeout=60
-            )
-            if response.status_code == 200:
-                return response.json()
+            return self.fetch_goal_plan(goal_name, target_amount, months, income, persona,
+                                        months_list, current_savings, include_advice)
         except requests.exceptions.Timeout:
             st.warning("Request timed out. The AI model might be loading.")
             return {}
@@ -148,24 +327,108 @@ class APIClient:
             st.error(f"Goal planning failed: {str(e)}")
         return {}
 
+    def _post_single_flight(self, path: str, payload: Dict, timeout: float) -> requests.Response:
+        """
+        POST payload to path, letting identical concurrent calls (same user, path
+        and body) wait for the one request already in flight instead of sending their own
+        """
+        headers = self._get_headers()
+        key = hashlib.blake2b(
+            json.dumps([path, payload, headers], sort_keys=True).encode()
+        ).hexdigest()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if owner:
+            try:
+                future.set_result(self.session.post(
+                    f"{self.base_url}{path}", headers=headers, json=payload, timeout=timeout
+                ))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._inflight_lock:
+                    del self._inflight[key]
+        return future.result()
+
+    def stream_goal_plan(self, goal_name: str, target_amount: float, months: int,
+                         income: float, persona: str = "professional",
+                         current_savings: float = 0.0) -> Iterator[str]:
+        """Stream AI goal advice chunk by chunk (for st.write_stream)"""
+        payload = {
+            "goal_name": goal_name,
+            "target_amount": target_amount,
+            "months": months,
+            "income": income,
+            "persona": persona,
+            "current_savings": current_savings
+        }
+        yield from self._stream_sse("/ai/goal-planner/stream", payload)
+
+    def stream_ai_advice(self, question: str, persona: str = "professional") -> Iterator[str]:
+        """Stream general AI financial advice chunk by chunk (for st.write_stream)"""
+        yield from self._stream_sse("/ai/generate/stream", {"question": question, "persona": persona})
+
+    def _stream_sse(self, path: str, payload: dict) -> Iterator[str]:
+        """POST payload and yield the JSON text chunks of a Server-Sent Events reply"""
+        try:
+            with self.session.post(
+                f"{self.base_url}{path}",
+                headers=self._get_headers(),
+                json=payload,
+                timeout=60,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    yield "Could not get AI advice right now. Please try again."
+                    return
+                # Text chunks come as unnamed JSON data events; named ones carry metadata,
+                # except "error", which means the reply broke off
+                event = None
+                for line in response.iter_lines(decode_unicode=True):
+                    _metrics().add(bytes_in=len(line.encode()) + 1)
+                    if not line:
+                        event = None
+                    elif line.startswith("event:"):
+                        event = line[6:].strip()
+                    elif line.startswith("data:") and event is None:
+                        yield json.loads(line[5:])
+                    elif line.startswith("data:") and event == "error":
+                        yield f"\n\nError: {json.loads(line[5:])}"
+                        return
+        except requests.exceptions.Timeout:
+            yield "Request timed out. The AI model might be loading. Please try again."
+        except Exception as e:
+            yield f"Error: {str(e)}"
+
+    def fetch_tax_advice(self, income: float, persona: str = "professional") -> str:
+        """AI-powered tax advice, raising on failure (no st.* calls, so safe off the script thread)"""
+        response = self._post_single_flight(
+            "/ai/tax-advice",
+            {"income": income, "persona": persona},
+            timeout=60
+        )
+        response.raise_for_status()
+        return response.json().get("tax_advice", "No advice available")
+
     def get_tax_advice(self, income: float, persona: str = "professional") -> str:
         """Get AI-powered tax advice"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/ai/tax-advice",
-                headers=self._get_headers(),
-                json={"income": income, "persona": persona},
-                timeout=60
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("tax_advice", "No advice available")
+            return self.fetch_tax_advice(income, persona)
         except requests.exceptions.Timeout:
             return "Request timed out. The AI model might be loading. Please try again."
         except Exception as e:
             st.error(f"Tax advice request failed: {str(e)}")
             return f"Error: {str(e)}"
 
+    @staticmethod
+    def get_stats() -> Dict[str, int]:
+        """This session's AI cache hits and misses, prefetches claimed finished or still running, and bytes received"""
+        return _metrics().snapshot()
+
     # ========== Compatibility Methods (for demo) ==========
 
     def login(self, email: str, password: str) -> Optional[Dict]:
@@ -175,13 +438,14 @@ class APIClient:
         try:
             response = self.session.post(
                 f"{self.base_url}/login",
-                json={"email": email, "password": password},
-                headers={"Content-Type": "application/json"}
+                json={"email": email, "password": password}
             )
             if response.status_code == 200:
                 data = response.json()
                 st.session_state["auth_token"] = data.get("access_token")
                 st.session_state["username"] = email.split('@')[0]
+                # The backend identifies users by their full email (the token subject)
+                st.session_state["user_id"] = email
                 st.session_state["name"] = data.get("name", "User")
                 return data
             else:
@@ -197,8 +461,7 @@ class APIClient:
         try:
             response = self.session.post(
                 f"{self.base_url}/signup",
-                json=user_data,
-                headers={"Content-Type": "application/json"}
+                json=user_data
             )
             if response.status_code == 200:
                 st.success("Account created successfully! Please login.")
@@ -208,3 +471,194 @@ class APIClient:
         except Exception as e:
             st.error(f"Signup failed: {str(e)}")
         return False
+
+
+@st.cache_resource
+def get_api_client(base_url: str) -> APIClient:
+    """Shared APIClient (and its pooled requests.Session) reused across reruns and sessions"""
+    return APIClient(base_url)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def cached_health(base_url: str) -> bool:
+    """Backend health, probed at most every 30 seconds"""
+    return get_api_client(base_url).check_health()
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def cached_health_status(base_url: str) -> Tuple[bool, Dict]:
+    """Backend health and model status, probed concurrently at most every 10 seconds"""
+    client = get_api_client(base_url)
+    healthy, status = run_async(client.acheck_health(), client.aget_health_status())
+    return healthy, status
+
+
+class _NoResult(Exception):
+    """Raised inside a cached wrapper so failed calls are not cached"""
+
+    def __init__(self, result=None):
+        super().__init__()
+        self.result = result
+
+
+# Set by an AI cache body when it runs, i.e. when the call missed the cache
+_cache_call = threading.local()
+
+
+def _cache_miss():
+    _cache_call.missed = True
+    if not getattr(_cache_call, "prefetching", False):
+        _metrics().add(misses=1)
+
+
+def _counted(fn: Callable, *args):
+    """Call a cached AI function, counting a hit unless its body ran"""
+    _cache_call.missed = False
+    try:
+        return fn(*args)
+    finally:
+        if not _cache_call.missed and not getattr(_cache_call, "prefetching", False):
+            _metrics().add(hits=1)
+
+
+def _prefetch(fn: Callable, *args):
+    """Run a fetch for prefetch_ai; it is not a lookup by the user, so it isn't counted"""
+    _cache_call.prefetching = True
+    try:
+        return fn(*args)
+    finally:
+        _cache_call.prefetching = False
+
+
+# Text replies that report a failure rather than advice
+_FAILED_REPLY_PREFIXES = ("Error:", "Request timed out", "Could not get AI advice")
+
+
+def failed_reply(reply: Optional[str]) -> bool:
+    """Whether a text reply (or the last chunk of a streamed one) reports a failure"""
+    return not reply or reply.lstrip().startswith(_FAILED_REPLY_PREFIXES)
+
+
+def error_message(error: Exception) -> str:
+    """What to tell the user when one of the cached AI calls below raised"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return "Request timed out. The AI model might be loading. Please try again."
+    return f"Error: {str(error)}"
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _dashboard(base_url: str, token: Optional[str], limit: int) -> Tuple[List[Dict], Dict]:
+    transactions, analytics = get_api_client(base_url).fetch_dashboard(limit)
+    if not analytics:
+        raise _NoResult((transactions, analytics))
+    return transactions, analytics
+
+
+def cached_dashboard(base_url: str, limit: int = 10) -> Tuple[List[Dict], Dict]:
+    """fetch_dashboard memoized for 30 seconds, kept apart per signed-in user"""
+    try:
+        return _dashboard(base_url, st.session_state.get("auth_token"), limit)
+    except _NoResult as e:
+        return e.result
+
+
+def clear_dashboard():
+    """Drop every user's cached dashboard, e.g. after a transaction is added"""
+    _dashboard.clear()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _goal_plan(base_url: str, token: Optional[str], goal_name: str, target_amount: float, months: int,
+               income: float, persona: str, months_list: Optional[Tuple[int, ...]],
+               current_savings: float, include_advice: bool) -> Dict:
+    _cache_miss()
+    return get_api_client(base_url).fetch_goal_plan(
+        goal_name, target_amount, months, income, persona,
+        months_list=list(months_list) if months_list else None,
+        current_savings=current_savings,
+        include_advice=include_advice
+    )
+
+
+def cached_goal_plan(base_url: str, goal_name: str, target_amount: float, months: int,
+                     income: float, persona: str = "professional",
+                     months_list: Optional[Tuple[int, ...]] = None,
+                     current_savings: float = 0.0,
+                     include_advice: bool = True) -> Dict:
+    """
+    fetch_goal_plan memoized for an hour per set of inputs, kept apart per signed-in user;
+    failures raise (and aren't cached) so the caller can show them, e.g. with error_message()
+    """
+    return _counted(_goal_plan, base_url, st.session_state.get("auth_token"), goal_name, target_amount,
+                    months, income, persona, months_list, current_savings, include_advice)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _budget_analysis(base_url: str, token: Optional[str], income: float,
+                     expenses: Tuple[Tuple[str, float], ...], persona: str) -> Dict:
+    _cache_miss()
+    return get_api_client(base_url).fetch_budget_analysis(income, dict(expenses), persona)
+
+
+def cached_budget_analysis(base_url: str, income: float, expenses: Dict[str, float],
+                           persona: str = "professional") -> Dict:
+    """fetch_budget_analysis memoized for an hour per set of inputs and user; failures raise, as in cached_goal_plan"""
+    expense_items = tuple(sorted(expenses.items()))
+    prefetched = _take_prefetch(("budget", base_url, income, expense_items, persona))
+    if prefetched is not None:
+        return prefetched.result()
+    return _fetch_budget_analysis(base_url, income, expense_items, persona)
+
+
+def _fetch_budget_analysis(base_url: str, income: float, expense_items: Tuple[Tuple[str, float], ...],
+                           persona: str) -> Dict:
+    return _counted(_budget_analysis, base_url, st.session_state.get("auth_token"),
+                    income, expense_items, persona)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _tax_advice(base_url: str, token: Optional[str], income: float, persona: str) -> str:
+    _cache_miss()
+    return get_api_client(base_url).fetch_tax_advice(income, persona)
+
+
+def cached_tax_advice(base_url: str, income: float, persona: str = "professional") -> str:
+    """fetch_tax_advice memoized for an hour per (income, persona) and user; failures raise, as in cached_goal_plan"""
+    prefetched = _take_prefetch(("tax", base_url, income, persona))
+    if prefetched is not None:
+        return prefetched.result()
+    return _fetch_tax_advice(base_url, income, persona)
+
+
+def _fetch_tax_advice(base_url: str, income: float, persona: str) -> str:
+    return _counted(_tax_advice, base_url, st.session_state.get("auth_token"), income, persona)
+
+
+def prefetch_ai(base_url: str, annual_income: float, monthly_income: float,
+                expenses: Dict[str, float], persona: str = "professional"):
+    """
+    Start the tax advice and budget analysis for the given inputs in the background,
+    once per session, so opening those pages finds the answers ready (or in flight).
+    Call it only once the user has shown they want the analysis: each one is an LLM call.
+    """
+    if "_prefetch" in st.session_state:
+        return
+    expense_items = tuple(sorted(expenses.items()))
+    ctx = get_script_run_ctx()
+    pool = _prefetch_pool()
+    st.session_state._prefetch = {
+        ("budget", base_url, monthly_income, expense_items, persona):
+            pool.submit(_run_with_ctx, ctx, _prefetch, _fetch_budget_analysis,
+                        base_url, monthly_income, expense_items, persona),
+        ("tax", base_url, annual_income, persona):
+            pool.submit(_run_with_ctx, ctx, _prefetch, _fetch_tax_advice, base_url, annual_income, persona),
+    }
+
+
+def _take_prefetch(key: tuple) -> Optional[Future]:
+    """Claim the prefetch for key, if any, counting whether it had already finished"""
+    prefetch = st.session_state.get("_prefetch")
+    future = prefetch.pop(key, None) if prefetch else None
+    if future is not None:
+        _metrics().add(**{"prefetch_hits" if future.done() else "prefetch_misses": 1})
+    return future
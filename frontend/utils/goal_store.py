@@ -0,0 +1,110 @@
+"""
+Persistent storage for user goals.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import uuid
+from typing import Callable
+import streamlit as st
+from config.settings import APP_DATA_DIR
+
+# Demo goals, only added when the user asks for them
+SAMPLE_GOALS = {
+    "Emergency Fund": {
+        "name": "Emergency Fund",
+        "target": 300000,
+        "current": 180000,
+        "category": "Emergency Fund",
+        "deadline": "Dec 2025",
+        "monthly_required": 10000
+    },
+    "Dream Vacation to Europe": {
+        "name": "Dream Vacation to Europe",
+        "target": 150000,
+        "current": 52500,
+        "category": "Travel",
+        "deadline": "Jun 2025",
+        "monthly_required": 12000
+    },
+    "New Laptop": {
+        "name": "New Laptop",
+        "target": 80000,
+        "current": 64000,
+        "category": "Other",
+        "deadline": "Jan 2025",
+        "monthly_required": 8000
+    }
+}
+
+
+def _goals_path(user_id: str) -> str:
+    """Path of the pickle file holding a user's goals, named by a hash of their id"""
+    digest = hashlib.blake2b(user_id.encode(), digest_size=16).hexdigest()
+    return os.path.join(APP_DATA_DIR, f"goals_{digest}.pkl")
+
+
+def load_goals(user_id: str) -> dict:
+    """Load a user's saved goals from disk (empty if they have none)"""
+    path = _goals_path(user_id)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    return {}
+
+
+def sample_goals() -> dict:
+    """A fresh copy of the demo goals, each with a new id"""
+    return {name: {**goal, "id": uuid.uuid4().hex} for name, goal in SAMPLE_GOALS.items()}
+
+
+@st.cache_resource
+def goals_store() -> dict:
+    """Process-wide goals keyed by user id, shared by all of a user's sessions"""
+    return {}
+
+
+# Guards goals_store() and the goal files, which every session touches
+_store_lock = threading.Lock()
+
+
+def _shared_goals(user_id: str) -> dict:
+    """The user's goals in the shared store, loaded from disk on first use (hold _store_lock)"""
+    store = goals_store()
+    if user_id not in store:
+        goals = load_goals(user_id)
+        # Goals saved before ids were introduced get one now
+        for goal in goals.values():
+            goal.setdefault("id", uuid.uuid4().hex)
+        store[user_id] = goals
+    return store[user_id]
+
+
+def get_goals(user_id: str) -> dict:
+    """A snapshot of a user's goals; change them only through update_goals"""
+    with _store_lock:
+        return dict(_shared_goals(user_id))
+
+
+def update_goals(user_id: str, change: Callable[[dict], None]) -> dict:
+    """
+    Apply change to the user's shared goals and write them to disk, all under the
+    lock so other sessions of the same user never see (or save) a half-made change.
+    change should replace a goal's dict rather than edit it in place, since earlier
+    snapshots share them. Returns a fresh snapshot.
+    """
+    with _store_lock:
+        goals = _shared_goals(user_id)
+        change(goals)
+        os.makedirs(APP_DATA_DIR, exist_ok=True)
+        with open(_goals_path(user_id), "wb") as f:
+            pickle.dump(goals, f)
+        return dict(goals)
+
+
+def forget_goals(user_id: str):
+    """Drop a user's goals from the shared store (they stay on disk), e.g. on logout"""
+    with _store_lock:
+        goals_store().pop(user_id, None)
@@ -3,8 +3,43 @@ Session state management for the Streamlit application.
 """
 
 import streamlit as st
+from collections import deque
 from datetime import datetime
 
+# Most recent entries kept in the session
+MAX_RECENT_TRANSACTIONS = 50
+MAX_CHAT_HISTORY = 500
+
+
+@st.cache_resource
+def global_state() -> dict:
+    """Process-wide per-user copies of selected session keys, kept across session restarts"""
+    return {}
+
+
+def save_state(user_id: str, key: str, value):
+    """Set a session key and mirror it into the user's global state"""
+    st.session_state[key] = value
+    global_state().setdefault(user_id, {})[key] = value
+
+
+def mirror_state(user_id: str, *keys: str):
+    """Copy session keys (e.g. widget values, which can't be re-set) into the user's global state"""
+    saved = global_state().setdefault(user_id, {})
+    for key in keys:
+        saved[key] = st.session_state[key]
+
+
+def hydrate_state(user_id: str):
+    """Restore the user's mirrored keys into a fresh session without overwriting live values"""
+    for key, value in global_state().get(user_id, {}).items():
+        st.session_state.setdefault(key, value)
+
+
+def clear_state(user_id: str):
+    """Drop the user's global state, e.g. on logout"""
+    global_state().pop(user_id, None)
+
 
 class SessionState:
     def __init__(self):
@@ -18,8 +53,8 @@ class SessionState:
             'monthly_income': 0,
             'monthly_expenses': 0,
             'active_goals': [],
-            'recent_transactions': [],
-            'chat_history': [],
+            'recent_transactions': deque(maxlen=MAX_RECENT_TRANSACTIONS),
+            'chat_history': deque(maxlen=MAX_CHAT_HISTORY),
             'current_page': 'dashboard',
             'show_transaction_form': False,
             'show_analysis': False,
@@ -33,9 +68,9 @@ class SessionState:
                 st.session_state[key] = value
 
     def reset(self):
-        """Reset session state to defaults"""
-        for key, value in self.defaults.items():
-            st.session_state[key] = value
+        """Reset session state to defaults, dropping every other key (page state, caches, metrics)"""
+        st.session_state.clear()
+        self.init()
 
     def update_financial_summary(self, data: dict):
         """Update financial summary in session"""
@@ -45,22 +80,19 @@ class SessionState:
         st.session_state.monthly_expenses = data.get('monthly_expenses', 0)
 
     def add_transaction(self, transaction: dict):
-        """Add transaction to recent list"""
+        """Add transaction to the front of the recent list (the oldest drops off past the limit)"""
         if 'recent_transactions' not in st.session_state:
-            st.session_state.recent_transactions = []
+            st.session_state.recent_transactions = deque(maxlen=MAX_RECENT_TRANSACTIONS)
 
-        st.session_state.recent_transactions.insert(0, {
+        st.session_state.recent_transactions.appendleft({
             **transaction,
             'timestamp': datetime.now()
         })
 
-        # Keep only last 50 transactions
-        st.session_state.recent_transactions = st.session_state.recent_transactions[:50]
-
     def add_chat_message(self, role: str, content: str):
-        """Add message to chat history"""
+        """Add message to chat history (the oldest drops off past the limit)"""
         if 'chat_history' not in st.session_state:
-            st.session_state.chat_history = []
+            st.session_state.chat_history = deque(maxlen=MAX_CHAT_HISTORY)
 
         st.session_state.chat_history.append({
             'role': role,
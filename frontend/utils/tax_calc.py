@@ -0,0 +1,78 @@
+"""
+Income tax calculation and charts shared by the Tax Planner pages.
+"""
+
+import numpy as np
+import streamlit as st
+
+# Simplified new regime: slab lower edges, tax due at each edge, and the rate (%) above it
+SLAB_LABELS = ("0-2.5L", "2.5-5L", "5-7.5L", "7.5-10L", "10-12.5L", "12.5-15L", ">15L")
+SLAB_EDGES = np.array([0, 2.5e5, 5e5, 7.5e5, 1e6, 1.25e6, 1.5e6])
+BASE_TAX = np.array([0, 0, 12500, 37500, 75000, 125000, 187500])
+SLAB_RATES = np.array([0, 5, 10, 15, 20, 25, 30])
+MARGINAL = SLAB_RATES / 100
+
+# 4% health and education cess on top of the slab tax
+CESS_RATE = 0.04
+
+# Flat standard deduction for salaried income
+STANDARD_DEDUCTION = 50000
+
+
+def compute_tax_vec(taxable_income):
+    """Tax payable including cess, for a scalar income or an array of incomes"""
+    income = np.maximum(np.asarray(taxable_income, dtype=float), 0)
+    idx = np.searchsorted(SLAB_EDGES, income, side='right') - 1
+    tax = BASE_TAX[idx] + (income - SLAB_EDGES[idx]) * MARGINAL[idx]
+    return tax * (1 + CESS_RATE)
+
+
+@st.cache_data(max_entries=1024)
+def compute_tax(taxable_income: int) -> float:
+    """Tax payable under the simplified new regime, including cess"""
+    return float(compute_tax_vec(taxable_income))
+
+
+def sum_deductions(d80c: float, d80d: float, other: float, standard: float = STANDARD_DEDUCTION) -> float:
+    """Total deductions claimed, including the standard deduction"""
+    return d80c + d80d + other + standard
+
+
+@st.cache_data(max_entries=256)
+def tax_breakdown_figure(income: float, tax: float, deductions: float) -> dict:
+    """Income split into tax, deductions and net income, as a donut chart"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[go.Pie(
+        labels=["Tax Payable", "Deductions", "Net Income"],
+        values=[tax, deductions, income - tax - deductions],
+        hole=0.4,
+        marker=dict(colors=['#f5576c', '#feca57', '#84fab0'])
+    )])
+
+    fig.update_layout(
+        title="Income Distribution",
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig.to_dict()
+
+
+@st.cache_data
+def slab_bar_figure() -> dict:
+    """New regime slab rates; static, so built once"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(data=[
+        go.Bar(x=list(SLAB_LABELS), y=SLAB_RATES.tolist(), marker_color='#667eea')
+    ])
+
+    fig.update_layout(
+        title="Income Tax Slabs (New Regime)",
+        xaxis_title="Income Slab",
+        yaxis_title="Tax Rate (%)",
+        height=400,
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0.02)'
+    )
+    return fig.to_dict()